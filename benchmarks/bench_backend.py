@@ -0,0 +1,36 @@
+"""Benchmark the native interpolant backend against scipy's interp1d.
+
+Run from the repository root with ``python -m benchmarks.bench_backend``.
+"""
+
+from polare.interpolant import Interp
+import numpy as np
+import timeit
+
+
+def main():
+
+    x = np.linspace(0, 10, 1000)
+    y = np.sin(x)
+
+    print(f"{'points':>10} {'kind':>10} {'scipy':>12} {'polare':>12} {'speedup':>8}")
+
+    for m in [1, 10 ** 2, 10 ** 4, 10 ** 6]:
+
+        xnew = np.linspace(0, 10, m)
+        number = max(1, 10 ** 6 // m)
+
+        for kind in ["linear", "quadratic", "cubic"]:
+
+            f_scipy = Interp(x, y, kind, backend="scipy")
+            f_polare = Interp(x, y, kind, backend="polare")
+
+            t_scipy = timeit.timeit(lambda: f_scipy(xnew), number=number) / number
+            t_polare = timeit.timeit(lambda: f_polare(xnew), number=number) / number
+
+            print(f"{m:>10} {kind:>10} {t_scipy * 1e3:>10.3f}ms {t_polare * 1e3:>10.3f}ms "
+                  f"{t_scipy / t_polare:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
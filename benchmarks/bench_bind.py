@@ -0,0 +1,42 @@
+"""Benchmark repeated evaluation on a fixed grid with a bound plan.
+
+Run from the repository root with ``python -m benchmarks.bench_bind``.
+"""
+
+from polare import Stroke
+import numpy as np
+import timeit
+
+
+def main():
+
+    rng = np.random.default_rng(0)
+
+    x = np.sort(rng.uniform(0, 10, 1000))
+    x[[0, -1]] = 0, 10
+
+    f = Stroke(x, np.sin(x), "cubic")
+    g = Stroke(x, np.cos(x), "linear")
+    h = Stroke(np.linspace(0, 10, 500), np.exp(-np.linspace(0, 10, 500)), "cubic")
+
+    s = f * g + np.sqrt(h) - 2 * f / (g + 3)
+
+    print(f"{'points':>10} {'__call__':>12} {'compile':>12} {'bind':>12} {'speedup':>8}")
+
+    for m in [10 ** 3, 10 ** 5, 10 ** 6]:
+
+        xnew = np.linspace(0, 10, m)
+        number = max(3, 10 ** 5 // m)
+
+        plan, bound = s.compile(), s.bind(xnew)
+
+        t_call = timeit.timeit(lambda: s(xnew), number=number) / number
+        t_plan = timeit.timeit(lambda: plan(xnew), number=number) / number
+        t_bound = timeit.timeit(lambda: bound(), number=number) / number
+
+        print(f"{m:>10} {t_call * 1e3:>10.3f}ms {t_plan * 1e3:>10.3f}ms {t_bound * 1e3:>10.3f}ms "
+              f"{t_call / t_bound:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
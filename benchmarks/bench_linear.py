@@ -0,0 +1,54 @@
+"""Benchmark the linear interpolation kernel against the former paths.
+
+Run from the repository root with ``python -m benchmarks.bench_linear``.
+"""
+
+from polare.interpolant import Interp, _as_points
+import numpy as np
+import timeit
+
+
+def piecewise(f, x):
+    """Linear interpolation as a located piecewise polynomial."""
+
+    x = _as_points(x, False)
+
+    return f._at(*f._grid.locate(x))
+
+
+def main():
+
+    rng = np.random.default_rng(0)
+
+    x = np.sort(rng.uniform(0, 10, 1000))
+    x[[0, -1]] = 0, 10
+    y = np.sin(x)
+
+    f_scipy = Interp(x, y, "linear", backend="scipy")
+    f_polare = Interp(x, y, "linear")
+
+    print(f"{'points':>10} {'scipy':>12} {'piecewise':>12} {'kernel':>12} {'speedup':>8}")
+
+    for m in [1, 10 ** 3, 10 ** 5, 10 ** 7]:
+
+        xnew = np.linspace(0, 10, m)
+        number = max(3, 10 ** 4 // m)
+
+        t_scipy = timeit.timeit(lambda: f_scipy(xnew), number=number) / number
+        t_piecewise = timeit.timeit(lambda: piecewise(f_polare, xnew), number=number) / number
+        t_kernel = timeit.timeit(lambda: f_polare(xnew), number=number) / number
+
+        print(f"{m:>10} {t_scipy * 1e3:>10.3f}ms {t_piecewise * 1e3:>10.3f}ms {t_kernel * 1e3:>10.3f}ms "
+              f"{min(t_scipy, t_piecewise) / t_kernel:>7.1f}x")
+
+    xs = np.linspace(0, 10, 10 ** 6)
+    ys = np.sin(xs)
+
+    t_scipy = timeit.timeit(lambda: Interp(xs, ys, "linear", backend="scipy"), number=3) / 3
+    t_kernel = timeit.timeit(lambda: Interp(xs, ys, "linear"), number=3) / 3
+
+    print(f"\nconstruction from 1e6 points: scipy {t_scipy * 1e3:.3f}ms, kernel {t_kernel * 1e3:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the fused power kernel against the former instruction expansion.
+
+Run from the repository root with ``python -m benchmarks.bench_power``.
+"""
+
+from polare._numpy_ufunc_overrides import _power
+import numpy as np
+import timeit
+
+
+def expanded_power(a, b):
+    """Sign-preserving power as the former ten-instruction expansion."""
+
+    t0 = np.less(a, 0)
+    t1 = np.mod(b, 2)
+    t2 = np.not_equal(t1, 0)
+    t3 = np.logical_and(t0, t2)
+    t4 = np.logical_not(t3)
+    t5 = np.multiply(t4, 2)
+    t6 = np.subtract(t5, 1)
+    t7 = np.absolute(a)
+    t8 = np.power(t7, b)
+
+    return np.multiply(t6, t8)
+
+
+def main():
+
+    rng = np.random.default_rng(0)
+
+    print(f"{'points':>10} {'exponent':>10} {'expanded':>12} {'fused':>12} {'speedup':>8}")
+
+    for m in [10 ** 3, 10 ** 5, 10 ** 7]:
+
+        a = rng.normal(size=m)
+        number = max(1, 10 ** 7 // m)
+
+        for b in [2, 3, 2.5, rng.integers(-3, 4, m).astype(float)]:
+
+            t_expanded = timeit.timeit(lambda: expanded_power(a, b), number=number) / number
+            t_fused = timeit.timeit(lambda: _power(a, b), number=number) / number
+
+            label = "array" if np.ndim(b) else str(b)
+            print(f"{m:>10} {label:>10} {t_expanded * 1e3:>10.3f}ms {t_fused * 1e3:>10.3f}ms "
+                  f"{t_expanded / t_fused:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
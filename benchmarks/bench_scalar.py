@@ -0,0 +1,38 @@
+"""Benchmark single point evaluation against the array path.
+
+Run from the repository root with ``python -m benchmarks.bench_scalar``.
+"""
+
+from polare import Stroke
+import numpy as np
+import timeit
+
+
+def main():
+
+    x = np.linspace(0, 3, 100)
+
+    f = Stroke(x, np.cos(x), "cubic")
+    g = Stroke(x, np.sin(x), "linear")
+
+    strokes = {
+        "leaf": f,
+        "10 operations": np.sin(f * g) + f ** 3 - np.power(g, 2.5) / (f + 3) - 2 * np.exp(g),
+    }
+
+    number = 10 ** 4
+
+    print(f"{'stroke':>14} {'__call__':>12} {'scalar':>12} {'speedup':>8}")
+
+    for name, s in strokes.items():
+
+        s.scalar(1.3)
+
+        t_call = timeit.timeit(lambda: s(1.3), number=number) / number
+        t_scalar = timeit.timeit(lambda: s.scalar(1.3), number=number) / number
+
+        print(f"{name:>14} {t_call * 1e6:>10.2f}us {t_scalar * 1e6:>10.2f}us {t_call / t_scalar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
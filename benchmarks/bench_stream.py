@@ -0,0 +1,37 @@
+"""Benchmark appending data points to a streaming leaf against refitting.
+
+Run from the repository root with ``python -m benchmarks.bench_stream``.
+"""
+
+from polare.interpolant import Interp, Stream
+import numpy as np
+import timeit
+
+
+def main():
+
+    print(f"{'points':>10} {'refit':>12} {'append':>12} {'window':>12}")
+
+    for n in [10 ** 3, 10 ** 5, 10 ** 6]:
+
+        x = np.linspace(0, 10, n)
+        y = np.sin(x)
+        step = x[1] - x[0]
+
+        stream = Stream(x, y, "cubic")
+        window = Stream(x, y, "cubic", window=n)
+
+        xs = x[-1] + step * np.arange(1, 10 ** 4 + 1)
+        ys = np.sin(xs)
+
+        number = max(3, 10 ** 5 // n)
+        t_refit = timeit.timeit(lambda: Interp(x, y, "cubic"), number=number) / number
+
+        t_append = timeit.timeit(lambda: [stream._append(xi, yi) for xi, yi in zip(xs, ys)], number=1) / len(xs)
+        t_window = timeit.timeit(lambda: [window._append(xi, yi) for xi, yi in zip(xs, ys)], number=1) / len(xs)
+
+        print(f"{n:>10} {t_refit * 1e3:>10.3f}ms {t_append * 1e6:>10.2f}us {t_window * 1e6:>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,2 @@
-
-from polare.stroke import Stroke
+from polare.stroke import Stroke, evaluate_many
+from polare.cache import ResultCache
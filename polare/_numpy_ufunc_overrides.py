@@ -1,6 +1,7 @@
 
 
 import numpy as np
+import math
 
 
 HANDLED_FUNCTIONS = {}
@@ -13,12 +14,187 @@ def implements(np_function):
     return decorator
 
 
-@implements(np.power)
-def power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
-    """NumPy's `power` universal function override.
+MAX_MULTIPLY_EXPONENT = 16
+
+
+def _integer_power(a: np.ndarray, k: int) -> np.ndarray:
+    """Raise an inexact array to an integer power by repeated multiplication.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        Base array of floating or complex dtype.
+    k : int
+        Exponent.
+
+    Returns
+    -------
+    np.ndarray
+        Newly allocated array of ``a ** k``.
+    """
+
+    result, base, m = None, a, abs(k)
+
+    while m:
+        if m & 1:
+            result = base.copy() if result is None else np.multiply(result, base, out=result)
+        m >>= 1
+        if m:
+            base = base * base
+
+    if result is None:
+        result = np.ones_like(a)
+
+    if k < 0:
+        result = np.true_divide(1, result, out=result)
+
+    return result
+
+
+def _signed_power(ufunc, a, b) -> np.ndarray:
+    """Raise the magnitude of a base to a power, preserving odd-power signs.
 
     Parameters
     ----------
+    ufunc : ufunc
+        Either `np.power` or `np.float_power`.
+    a : array_like
+        Base.
+    b : array_like
+        Exponent.
+
+    Returns
+    -------
+    np.ndarray
+        ``-|a| ** b`` where `a` is negative and `b` is not an even integer, and
+        ``|a| ** b`` elsewhere.
+
+    Notes
+    -----
+    Bases are negative where ``a < 0``, so ``-0.0`` counts as positive.
+
+    Scalar integer exponents up to `MAX_MULTIPLY_EXPONENT` in magnitude are
+    evaluated by repeated multiplication of an inexact base. Every
+    multiplication rounds, so for exponents other than 2 the result may
+    differ from ``|a| ** b`` in the last few bits.
+    """
+
+    if ufunc is np.float_power:
+        a = np.asarray(a, dtype=np.result_type(a, np.float64))
+
+    if np.ndim(b) == 0 and np.ndim(a) > 0 and np.issubdtype(a.dtype, np.inexact) \
+            and np.isfinite(b) and float(b).is_integer() and abs(b) <= MAX_MULTIPLY_EXPONENT:
+        if not np.issubdtype(a.dtype, np.floating):
+            return _integer_power(a, int(b))
+        out = _integer_power(np.absolute(a), int(b))
+        if int(b) % 2:
+            np.negative(out, out=out, where=np.less(a, 0))
+        return out
+
+    out = ufunc(np.absolute(a), b)
+
+    inplace = out if np.ndim(out) else None
+
+    if np.ndim(b) == 0 and np.issubdtype(out.dtype, np.floating):
+        if np.mod(b, 2) != 0:
+            if inplace is None:
+                return np.negative(out) if np.less(a, 0) else out
+            np.negative(out, out=out, where=np.less(a, 0))
+        return out
+
+    mask = np.less(a, 0)
+    if np.ndim(mask) == 0 and not mask:
+        return out
+
+    mask = np.logical_and(mask, np.not_equal(np.mod(b, 2), 0))
+
+    if inplace is None:
+        return np.negative(out) if mask else out
+
+    return np.negative(out, out=out, where=mask)
+
+
+def _power(a, b) -> np.ndarray:
+    """Fused sign-preserving `np.power` kernel."""
+
+    return _signed_power(np.power, a, b)
+
+
+def _float_power(a, b) -> np.ndarray:
+    """Fused sign-preserving `np.float_power` kernel."""
+
+    return _signed_power(np.float_power, a, b)
+
+
+def _scalar_signed_power(ufunc, a, b):
+    """Evaluate `_signed_power` at a single point.
+
+    Parameters
+    ----------
+    ufunc : ufunc
+        Either `np.power` or `np.float_power`.
+    a : scalar, np.ndarray
+        Base.
+    b : scalar, np.ndarray
+        Exponent.
+
+    Returns
+    -------
+    scalar, np.ndarray
+        Same value as `_signed_power` at a single point.
+
+    Notes
+    -----
+    A `np.float64` base raised to a Python scalar exponent is evaluated on
+    scalars, rounding like the array kernel at every step, instead of
+    allocating arrays for the magnitude, the power and the sign mask. Other
+    operands are passed to `_signed_power`.
+    """
+
+    if not isinstance(a, np.float64) or not isinstance(b, (int, float)):
+        return _signed_power(ufunc, a, b)
+
+    base = abs(a)
+
+    if math.isfinite(b) and float(b).is_integer() and abs(b) <= MAX_MULTIPLY_EXPONENT:
+
+        k = int(b)
+        result, m = np.float64(1.0), abs(k)
+
+        while m:
+            if m & 1:
+                result = result * base
+            m >>= 1
+            if m:
+                base = base * base
+
+        if k < 0:
+            result = np.true_divide(1, result)
+    else:
+        result = ufunc(base, b)
+
+    return -result if a < 0 and b % 2 != 0 else result
+
+
+def _scalar_power(a, b):
+    """Single point counterpart of `_power`."""
+
+    return _scalar_signed_power(np.power, a, b)
+
+
+def _scalar_float_power(a, b):
+    """Single point counterpart of `_float_power`."""
+
+    return _scalar_signed_power(np.float_power, a, b)
+
+
+def _power_inst(kernel, es: int, ev: float, xs: int, xv: float, n: int) -> list:
+    """Return the instruction applying a fused power kernel.
+
+    Parameters
+    ----------
+    kernel : function
+        Fused power kernel.
     es : int
         Base instruction index for Stroke bases.
     ev : int, float
@@ -34,56 +210,21 @@ def power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
     -------
     List
         Instructions to append to Stroke._inst.
-
-    Notes
-    -----
-    This ufunc override enables `np.power` to bring integers to negative
-    integer powers.
     """
 
     if es is not None and xs is not None:
-
-        inst = [[np.less, es - n, None, 0],
-                [np.mod, xs - n, None, 2],
-                [np.not_equal, 1, None, 0],
-                [np.logical_and, 0, 2, None],
-                [np.logical_not, 3, None, None],
-                [np.multiply, 4, None, 2],
-                [np.subtract, 5, None, 1],
-                [np.absolute, es - n, None, None],
-                [np.power, 7, xs - n, None],
-                [np.multiply, 6, 8, None]]
-
+        inst = [[kernel, es - n, xs - n, None]]
     elif es is not None:
-
-        val = (xv % 2) != 0
-        inst = [[np.less, es - n, None, 0],
-                [np.logical_and, 0, None, val],
-                [np.logical_not, 1, None, None],
-                [np.multiply, 2, None, 2],
-                [np.subtract, 3, None, 1],
-                [np.absolute, es - n, None, None],
-                [np.power, 5, None, xv],
-                [np.multiply, 4, 6, None]]
-
+        inst = [[kernel, es - n, None, xv]]
     else:
-
-        val = ev < 0
-        inst = [[np.mod, xs - n, None, 2],
-                [np.not_equal, 0, None, 0],
-                [np.logical_and, 1, None, val],
-                [np.logical_not, 2, None, None],
-                [np.multiply, 3, None, 2],
-                [np.subtract, 4, None, 1],
-                [np.power, None, xs - n, np.absolute(ev)],
-                [np.multiply, 5, 6, None]]
+        inst = [[kernel, None, xs - n, ev]]
 
     return inst
 
 
-@implements(np.float_power)
-def float_power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
-    """NumPy's `float_power` universal function override.
+@implements(np.power)
+def power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
+    """NumPy's `power` universal function override.
 
     Parameters
     ----------
@@ -105,45 +246,41 @@ def float_power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
 
     Notes
     -----
-    This ufunc override enables `np.float_power` to bring integers to negative
-    integer powers.
+    This ufunc override enables `np.power` to bring integers to negative
+    integer powers. The sign of negative bases is kept for exponents that are
+    not even integers, all within a single fused instruction.
     """
 
-    if es is not None and xs is not None:
+    return _power_inst(_power, es, ev, xs, xv, n)
 
-        inst = [[np.less, es - n, None, 0],
-                [np.mod, xs - n, None, 2],
-                [np.not_equal, 1, None, 0],
-                [np.logical_and, 0, 2, None],
-                [np.logical_not, 3, None, None],
-                [np.multiply, 4, None, 2],
-                [np.subtract, 5, None, 1],
-                [np.absolute, es - n, None, None],
-                [np.float_power, 7, xs - n, None],
-                [np.multiply, 6, 8, None]]
 
-    elif es is not None:
+@implements(np.float_power)
+def float_power(es: int, ev: float, xs: int, xv: float, n: int) -> list:
+    """NumPy's `float_power` universal function override.
 
-        val = (xv % 2) != 0
-        inst = [[np.less, es - n, None, 0],
-                [np.logical_and, 0, None, val],
-                [np.logical_not, 1, None, None],
-                [np.multiply, 2, None, 2],
-                [np.subtract, 3, None, 1],
-                [np.absolute, es - n, None, None],
-                [np.float_power, 5, None, xv],
-                [np.multiply, 4, 6, None]]
+    Parameters
+    ----------
+    es : int
+        Base instruction index for Stroke bases.
+    ev : int, float
+        Base value for scalar bases.
+    xs : int
+        Exponent instruction index for Stroke exponents.
+    xv : int, float
+        Exponent value for scalar exponents.
+    n : int
+        Prior instruction index.
 
-    else:
+    Returns
+    -------
+    List
+        Instructions to append to Stroke._inst.
 
-        val = ev < 0
-        inst = [[np.mod, xs - n, None, 2],
-                [np.not_equal, 0, None, 0],
-                [np.logical_and, 1, None, val],
-                [np.logical_not, 2, None, None],
-                [np.multiply, 3, None, 2],
-                [np.subtract, 4, None, 1],
-                [np.float_power, None, xs - n, np.absolute(ev)],
-                [np.multiply, 5, 6, None]]
+    Notes
+    -----
+    This ufunc override enables `np.float_power` to bring integers to negative
+    integer powers. The sign of negative bases is kept for exponents that are
+    not even integers, all within a single fused instruction.
+    """
 
-    return inst
+    return _power_inst(_float_power, es, ev, xs, xv, n)
@@ -1,10 +1,116 @@
 
 
+from polare._numpy_ufunc_overrides import (_float_power, _power, _scalar_float_power,
+                                           _scalar_power)
+from polare.interpolant import Constant, _sort_points, _unsort
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import numpy as np
 import numpy.typing as npt
+import importlib
+import operator
+import math
 
 
-def _extend_inst(inst1: list, n1: int, inst2: list, n2: int) -> list:
+CHUNK_SIZE = 2 ** 16
+
+
+def _inst_key(inst: list) -> tuple:
+    """Return a hashable key identifying an instruction.
+
+    Parameters
+    ----------
+    inst : array
+        Instruction array.
+
+    Returns
+    -------
+    tuple, None
+        Key shared by instructions computing the same value, or `None` if the
+        instruction cannot be keyed.
+
+    Notes
+    -----
+    Leaves are keyed by the identity of their interpolant so that distinct
+    data series are never merged. The type of the scalar operand is part of the
+    key so that, for example, ``0`` and ``False`` remain distinct, and so is
+    the sign of float operands so that ``0.0`` and ``-0.0`` do.
+    """
+
+    opp, a, b, val = inst
+
+    if opp is None:
+        return (None, id(val))
+
+    key = (opp, a, b, type(val), val)
+    if isinstance(val, (float, np.floating)):
+        key += (math.copysign(1.0, val),)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _inst_keys(inst: list, n: int) -> dict:
+    """Return the key table of an instruction array.
+
+    Parameters
+    ----------
+    inst : array
+        1D array containing instruction arrays.
+    n : int
+        Number of leading instructions to key.
+
+    Returns
+    -------
+    dict
+        Mapping of instruction keys to the list of indices they occur at.
+    """
+
+    keys = {}
+
+    for i in range(n):
+        key = _inst_key(inst[i])
+        if key is not None:
+            keys.setdefault(key, []).append(i)
+
+    return keys
+
+
+def _find_inst(keys: dict, key: tuple, inst: list):
+    """Return the index of a keyed instruction.
+
+    Parameters
+    ----------
+    keys : dict
+        Key table, as returned by `_inst_keys`.
+    key : tuple
+        Key of the instruction.
+    inst : array
+        1D array of instruction arrays to look the instruction up in.
+
+    Returns
+    -------
+    int, None
+        Index of the instruction in `inst`, or `None` if it is not there.
+
+    Notes
+    -----
+    Strokes branching off a common prefix share one key table, so an index
+    may point at an instruction another branch appended. Indices only count
+    if `inst` holds an instruction with the same key there.
+    """
+
+    for i in keys.get(key, ()):
+        if i < len(inst) and _inst_key(inst[i]) == key:
+            return i
+
+    return None
+
+
+def _extend_inst(inst1: list, n1: int, inst2: list, n2: int, keys: dict=None) -> tuple:
     """Combine instruction arrays.
 
     Parameters
@@ -17,62 +123,876 @@ def _extend_inst(inst1: list, n1: int, inst2: list, n2: int) -> list:
         1D array containing instruction arrays.
     n2 : int
         Length of `inst2`.
+    keys : dict, optional
+        Key table of `inst1`, as returned by `_inst_keys`, updated in place as
+        instructions are appended. Built from `inst1` if not provided.
 
     Returns
     -------
     array
         1D array containing the combined instruction arrays.
+    list
+        Index of each `inst2` instruction in the combined array.
+
+    Notes
+    -----
+    Instructions of `inst2` that are identical to an existing instruction,
+    including leaves sharing the same interpolant, point at the existing slot
+    rather than being appended again. Negative indices in `inst2` refer to
+    instructions of `inst1` relative to `n1`.
+
+    Only instructions the last instruction of `inst2` depends on are merged,
+    so instructions unreachable from it are never carried over. Their entry
+    in the returned index is `None`.
     """
 
+    if keys is None:
+        keys = _inst_keys(inst1, n1)
+
+    live = [False] * n2
+    if n2:
+        live[n2 - 1] = True
+
+    for i in range(n2 - 1, -1, -1):
+        if live[i]:
+            for j in inst2[i][1:3]:
+                if j is not None and j >= 0:
+                    live[j] = True
+
+    index = []
+
     for i in range(n2):
 
+        if not live[i]:
+            index.append(None)
+            continue
+
         opp, a, b, val = inst2[i][0], inst2[i][1], inst2[i][2], inst2[i][3]
 
         if a is not None:
-            a += n1
+            a = index[a] if a >= 0 else a + n1
 
         if b is not None:
-            b += n1
+            b = index[b] if b >= 0 else b + n1
+
+        new = [opp, a, b, val]
+        key = _inst_key(new)
+        j = None if key is None else _find_inst(keys, key, inst1)
+
+        if j is not None:
+            index.append(j)
+        else:
+            if key is not None:
+                keys.setdefault(key, []).append(len(inst1))
+            index.append(len(inst1))
+            inst1.append(new)
+
+    return inst1, index
+
+
+def _evaluate(inst: list, out, x: np.ndarray, ordered: bool,
+              grids: dict=None) -> np.ndarray:
+    """Evaluate a single instruction.
+
+    Parameters
+    ----------
+    inst : array
+        Instruction array.
+    out : array, dict
+        Results of previously evaluated instructions, indexed by instruction.
+    x : np.ndarray
+        Validated 1D array of increasing interpolation points.
+    ordered : bool
+        Whether the order of `x` has been verified, in which case leaves only
+        check its end points against their data.
+    grids : dict, optional
+        Located interpolation points of the grids shared by several leaves,
+        or `None` for grids not located yet. Leaves on these grids look their
+        points up here, locating them on first use, instead of interpolating
+        independently.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of the evaluated instruction.
+    """
+
+    opp, ia, ib, val = inst
+
+    if opp is None:
+
+        grid = getattr(val, "_grid", None)
+        if grids is None or grid not in grids:
+            return val._call(x, ordered)
+
+        located = grids[grid]
+        if located is None:
+            located = grids[grid] = grid.locate(x, ordered)
+
+        return val._at(*located)
+    elif ia is None:
+        a, b = val, out[ib]
+    elif ib is None:
+        a, b = out[ia], val
+    else:
+        a, b = out[ia], out[ib]
+
+    return opp(a) if b is None else opp(a, b)
+
+
+def _shared_grids(inst: list, order: list) -> dict:
+    """Return the grids shared by several leaves.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    order : list
+        Indices of the instructions to evaluate.
+
+    Returns
+    -------
+    dict
+        Grids used by more than one of the leaves, each mapped to `None`, for
+        `_evaluate` to store their located interpolation points in.
+    """
+
+    seen, shared = set(), {}
+
+    for i in order:
+
+        opp, _, _, val = inst[i]
+        grid = getattr(val, "_grid", None) if opp is None else None
+
+        if grid is not None:
+            if grid in seen:
+                shared[grid] = None
+            seen.add(grid)
+
+    return shared
+
+
+_SCALAR_OPERATORS = {np.add: operator.add, np.subtract: operator.sub, np.multiply: operator.mul,
+                     np.true_divide: operator.truediv, np.negative: operator.neg,
+                     np.positive: operator.pos, np.absolute: operator.abs, np.equal: operator.eq,
+                     np.not_equal: operator.ne, np.less: operator.lt, np.less_equal: operator.le,
+                     np.greater: operator.gt, np.greater_equal: operator.ge,
+                     _power: _scalar_power, _float_power: _scalar_float_power}
+
+
+def _scalar_plan(inst: list, n: int) -> list:
+    """Return the plan evaluating instructions at a single point.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction to evaluate.
+
+    Returns
+    -------
+    list
+        Tuples ``(i, opp, a, b, val)`` of the instructions `n` depends on, in
+        evaluation order.
+
+    Notes
+    -----
+    Elementwise arithmetic and comparison ufuncs are replaced by the
+    equivalent operators, which NumPy scalars implement with the same
+    semantics at a fraction of the cost of a ufunc call, and the fused power
+    kernels by their scalar counterparts.
+    """
+
+    plan = []
+
+    for i in _order(inst, n):
+        opp, a, b, val = inst[i]
+        plan.append((i, _SCALAR_OPERATORS.get(opp, opp), a, b, val))
+
+    return plan
+
+
+def _order(inst: list, n) -> list:
+    """Return the instructions an instruction depends on.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int, list
+        Index, or indices, of the instructions to evaluate.
+
+    Returns
+    -------
+    list
+        Increasing indices of the instructions `n` depends on, including `n`.
+
+    Notes
+    -----
+    Instructions only reference instructions at lower indices, so the list is
+    already in topological order and a single backward sweep suffices.
+    """
+
+    roots = [n] if isinstance(n, int) else list(n)
+
+    if not roots:
+        return []
+
+    needed = [False] * (max(roots) + 1)
+    for i in roots:
+        needed[i] = True
+
+    for i in range(len(needed) - 1, -1, -1):
+        if needed[i]:
+            a, b = inst[i][1], inst[i][2]
+            if a is not None:
+                needed[a] = True
+            if b is not None:
+                needed[b] = True
+
+    return [i for i in range(len(needed)) if needed[i]]
+
+
+def _channel_shape(inst: list, n: int) -> tuple:
+    """Return the shape of the channel axes of an instruction's result.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction.
+
+    Returns
+    -------
+    tuple
+        Shape of the leading, channel axes of the result, which is empty for
+        single channel results.
+    """
+
+    shapes = {}
+
+    for i in _order(inst, n):
+
+        opp, a, b, val = inst[i]
+
+        if opp is None:
+            shapes[i] = val._y.shape[:-1] if hasattr(val, "_y") else ()
+        elif opp is operator.getitem:
+            shapes[i] = np.empty(shapes[a] + (0,))[val].shape[:-1]
+        else:
+            operands = [shapes[j] for j in (a, b) if j is not None]
+            shapes[i] = np.broadcast_shapes(np.shape(val), *operands)
+
+    return shapes[n]
+
+
+def _prune(inst: list, n: int) -> list:
+    """Remove instructions an instruction does not depend on.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction to keep.
+
+    Returns
+    -------
+    array
+        1D array of the instructions `n` depends on, renumbered consecutively
+        and ending with `n`.
+    """
+
+    index, out = {}, []
+
+    for i in _order(inst, n):
+        opp, a, b, val = inst[i]
+        a = None if a is None else index[a]
+        b = None if b is None else index[b]
+        index[i] = len(out)
+        out.append([opp, a, b, val])
+
+    return out
+
+
+_BOOLEAN = {np.equal, np.not_equal, np.less, np.less_equal, np.greater,
+            np.greater_equal, np.logical_and, np.logical_or, np.logical_xor,
+            np.logical_not, np.isfinite, np.isinf, np.isnan, np.signbit}
+
+_SCALAR_FORMS = {np.add: "add", np.subtract: "add", np.multiply: "mul", np.true_divide: "div"}
+
+
+def _is_scalar(val) -> bool:
+    """Return `True` if `val` is a real, non-boolean scalar."""
+
+    return isinstance(val, (int, float, np.integer, np.floating)) and \
+        not isinstance(val, (bool, np.bool_))
+
+
+def _simplify(inst: list, n: int) -> list:
+    """Algebraically simplify instructions.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction to simplify.
+
+    Returns
+    -------
+    array
+        1D array of simplified instructions ending with the equivalent of `n`.
+
+    Notes
+    -----
+    Instructions are rewritten in a single forward pass:
+
+    - Instructions whose operands are all constant are folded into a constant.
+    - Chains of scalar additions and subtractions, or of scalar multiplications
+      and divisions, are folded into a single instruction.
+    - Identities such as ``s + 0``, ``s * 1``, ``s / 1`` and ``+s`` are
+      dropped.
+    - Double negations cancel.
+    - ``s - s`` and ``s / s`` on the same single channel instruction become
+      constants.
+
+    Folding scalars may change results by rounding. ``s - s`` becomes 0 even
+    where `s` is infinite, and ``s / s`` becomes 1 even where `s` is zero or
+    infinite, although evaluating them there gives `nan`. Chains that would
+    divide a scalar by zero are not folded. Identities are kept on boolean
+    instructions, such as comparisons, whose dtype they change.
+    """
+
+    out, keys = [], {}
+    index, form, boolean = {}, {}, set()
+
+    def constant(j):
+        leaf = out[j]
+        return leaf[3]._value if leaf[0] is None and isinstance(leaf[3], Constant) else None
+
+    def emit(new):
+        key = _inst_key(new)
+        if key is not None and key in keys:
+            return keys[key]
+        out.append(new)
+        if key is not None:
+            keys[key] = len(out) - 1
+        return len(out) - 1
+
+    for i in _order(inst, n):
+
+        opp, a, b, val = inst[i]
+
+        if opp is None:
+            index[i] = emit([None, None, None, val])
+            continue
 
-        inst1.append([opp, a, b, val])
+        a = None if a is None else index[a]
+        b = None if b is None else index[b]
 
-    return inst1
+        ca = None if a is None else constant(a)
+        cb = None if b is None else constant(b)
 
+        if a is not None and b is not None:
+            if ca is not None and cb is not None:
+                index[i] = emit([None, None, None, Constant(opp(ca, cb))])
+                continue
+            elif ca is not None:
+                a, val = None, ca
+            elif cb is not None:
+                b, val = None, cb
+            elif a == b and opp in (np.subtract, np.true_divide) and a not in boolean \
+                    and not _channel_shape(out, a):
+                index[i] = emit([None, None, None, Constant(0.0 if opp is np.subtract else 1.0)])
+                continue
 
-def _compute(inst: list, n: int, x: npt.ArrayLike, assume_ordered: bool) -> np.ndarray:
-    """Recursively compute instructions.
+        if (a is None and cb is not None) or (b is None and ca is not None):
+            c = cb if a is None else ca
+            if val is None:
+                value = opp(c)
+            else:
+                value = opp(val, c) if a is None else opp(c, val)
+            index[i] = emit([None, None, None, Constant(value)])
+            continue
+
+        if b is None and val is None:
+
+            if opp is np.positive and a not in boolean:
+                index[i] = a
+                continue
+
+            if opp is np.negative and out[a][0] is np.negative:
+                index[i] = out[a][1]
+                continue
+
+        elif opp in _SCALAR_FORMS and _is_scalar(val):
+
+            if b is None:
+                base, d = a, val
+            elif opp in (np.add, np.multiply):
+                base, d = b, val
+            else:
+                base = None
+
+            if base is not None and base not in boolean:
+
+                kind = _SCALAR_FORMS[opp]
+                d = -d if opp is np.subtract else d
+
+                if base in form and form[base][1] == "add" == kind:
+                    base, c = form[base][0], form[base][2] + d
+                elif base in form and form[base][1] != "add" != kind \
+                        and (form[base][1] == kind or (d if kind == "div" else form[base][2]) != 0):
+                    inner, inner_kind, c = form[base]
+                    if inner_kind == "mul":
+                        c = c * d if kind == "mul" else c / d
+                    elif kind == "div":
+                        c = c * d
+                    else:
+                        inner_kind, c = "mul", d / c
+                    base, kind = inner, inner_kind
+                else:
+                    c = d
+
+                if (kind == "add" and c == 0) or (kind != "add" and c == 1):
+                    index[i] = base
+                    continue
+
+                new = [{"add": np.add, "mul": np.multiply, "div": np.true_divide}[kind], base, None, c]
+                index[i] = emit(new)
+                form[index[i]] = (base, kind, c)
+                continue
+
+        index[i] = emit([opp, a, b, val])
+
+        if opp in _BOOLEAN:
+            boolean.add(index[i])
+
+    return _prune(out, index[n])
+
+
+def _compute(inst: list, n: int, x: npt.ArrayLike, assume_ordered: bool,
+             counts: list=None) -> np.ndarray:
+    """Compute instructions in a single linear pass.
 
     Parameters
     ----------
     inst : array
         1D array of instruction arrays.
     n : int
-        Length of `inst`.
+        Index of the instruction to evaluate.
     x : array_like
         1D array or scalar values representing interpolation points.
     assume_ordered : bool
         Assumes interpolation points are ordered in increasing order if `True`.
+    counts : list, optional
+        Per-instruction tallies incremented each time an instruction is
+        evaluated.
 
     Returns
     -------
     np.ndarray
         1D array of the evaluated instruction set.
+
+    Notes
+    -----
+    The instructions `n` depends on are evaluated in increasing order and each
+    result is stored by index. No recursion is involved, so expression depth
+    is unbounded, and an instruction referenced by several others is evaluated
+    once per call. The interpolation points are validated, and sorted if
+    need be, once rather than by every leaf, and are located once per grid
+    shared by leaves. The result is permuted back to the order of `x`.
     """
 
-    opp, val = inst[n][0], inst[n][3]
+    x, perm = _sort_points(x, assume_ordered)
+    ordered = not assume_ordered
 
-    if opp is None:
-        return val(x, assume_ordered)
-    elif inst[n][1] is None:
-        a = val
-        b = _compute(inst, inst[n][2], x, assume_ordered)
-    elif inst[n][2] is None:
-        a = _compute(inst, inst[n][1], x, assume_ordered)
-        b = val
-    else:
-        a = _compute(inst, inst[n][1], x, assume_ordered)
-        b = _compute(inst, inst[n][2], x, assume_ordered)
+    order = _order(inst, n)
+
+    out = [None] * (n + 1)
+    grids = _shared_grids(inst, order)
+
+    for i in order:
+
+        if counts is not None:
+            counts[i] += 1
+
+        out[i] = _evaluate(inst[i], out, x, ordered, grids)
+
+    return _unsort(out[n], perm)
+
+
+def _compute_parallel(inst: list, n: int, x: npt.ArrayLike, assume_ordered: bool,
+                      workers: int, counts: list=None) -> np.ndarray:
+    """Compute instructions concurrently on a thread pool.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction to evaluate.
+    x : array_like
+        1D array or scalar values representing interpolation points.
+    assume_ordered : bool
+        Assumes interpolation points are ordered in increasing order if `True`.
+    workers : int
+        Number of threads evaluating instructions.
+    counts : list, optional
+        Per-instruction tallies incremented each time an instruction is
+        evaluated.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of the evaluated instruction set.
+
+    Notes
+    -----
+    An instruction is submitted to the pool as soon as all of its operands are
+    evaluated, so independent branches of the instruction graph, such as
+    separate leaves, run concurrently. Results are released once every
+    instruction using them has been evaluated.
+    """
+
+    x, perm = _sort_points(x, assume_ordered)
+    ordered = not assume_ordered
+
+    order = _order(inst, n)
+
+    operands = {i: {j for j in inst[i][1:3] if j is not None} for i in order}
+    users = {i: [] for i in order}
+    for i in order:
+        for j in operands[i]:
+            users[j].append(i)
+
+    waiting = {i: len(operands[i]) for i in order}
+    pending = {i: len(users[i]) for i in order}
+    out, grids = {}, _shared_grids(inst, order)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        running = {executor.submit(_evaluate, inst[i], out, x, ordered, grids): i
+                   for i in order if waiting[i] == 0}
+
+        while running:
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+
+                i = running.pop(future)
+                out[i] = future.result()
+
+                if counts is not None:
+                    counts[i] += 1
+
+                for j in operands[i]:
+                    pending[j] -= 1
+                    if pending[j] == 0:
+                        del out[j]
+
+                for k in users[i]:
+                    waiting[k] -= 1
+                    if waiting[k] == 0:
+                        running[executor.submit(_evaluate, inst[k], out, x, ordered, grids)] = k
+
+    return _unsort(out[n], perm)
+
+
+def _compute_cached(inst: list, n: int, x: npt.ArrayLike, assume_ordered: bool,
+                    cache, counts: list=None) -> np.ndarray:
+    """Compute instructions reusing cached results.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Index of the instruction to evaluate.
+    x : array_like
+        1D array or scalar values representing interpolation points.
+    assume_ordered : bool
+        Assumes interpolation points are ordered in increasing order if `True`.
+    cache : ResultCache
+        Cache of instruction results.
+    counts : list, optional
+        Per-instruction tallies incremented each time an instruction is
+        evaluated.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of the evaluated instruction set.
+
+    Notes
+    -----
+    Each instruction is identified by its operation, scalar operand and the
+    identifiers of its operands, with leaves identified by their interpolant
+    and the version of its data. Identical sub-expressions of different
+    Strokes therefore share cache entries. A backward sweep stops at cached
+    results so that only the instructions they do not cover are evaluated.
+    """
+
+    order = _order(inst, n)
+    fingerprint = cache._fingerprint(x, assume_ordered)
+
+    x, perm = _sort_points(x, assume_ordered)
+    ordered = not assume_ordered
+
+    ids = {}
+    for i in order:
+
+        opp, a, b, val = inst[i]
+
+        if opp is None:
+            ids[i] = cache._node_id((None, val._uid, val._version), val)
+        elif (a is not None and ids[a] is None) or (b is not None and ids[b] is None):
+            ids[i] = None
+        else:
+            ids[i] = cache._node_id(_inst_key([opp, ids.get(a), ids.get(b), val]))
+
+    out, needed = {}, {n}
+
+    for i in reversed(order):
+
+        if i not in needed:
+            continue
+
+        if ids[i] is not None:
+            value = cache._get((fingerprint, ids[i]))
+            if value is not None:
+                out[i] = value
+                continue
+
+        needed.update(j for j in inst[i][1:3] if j is not None)
+
+    grids = _shared_grids(inst, [i for i in order if i in needed and i not in out])
+
+    for i in order:
+
+        if i not in needed or i in out:
+            continue
+
+        if counts is not None:
+            counts[i] += 1
+
+        out[i] = _evaluate(inst[i], out, x, ordered, grids)
+
+        if ids[i] is not None:
+            cache._put((fingerprint, ids[i]), out[i])
+
+    return _unsort(np.array(out[n]), perm)
+
+
+def _chunks(x: npt.ArrayLike, chunk_size: int):
+    """Split interpolation points into contiguous chunks.
 
-    temp = opp(a) if b is None else opp(a, b)
+    Parameters
+    ----------
+    x : array_like
+        1D array or scalar values representing interpolation points.
+    chunk_size : int
+        Maximum number of points per chunk.
+
+    Yields
+    ------
+    start, stop : int
+        Bounds of the chunk within `x`.
+    xc : np.ndarray
+        1D view of the chunk's interpolation points.
+
+    Notes
+    -----
+    Chunks are not sorted, which is left to the evaluation of each chunk.
+    """
+
+    if int(chunk_size) != chunk_size or chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer.")
+
+    x = np.asarray(x)
+
+    if x.ndim == 0:
+        x = x.reshape(1)
+    elif x.ndim != 1:
+        raise ValueError("x should be a scalar or 1D array.")
+
+    chunk_size = int(chunk_size)
+
+    for start in range(0, len(x), chunk_size):
+
+        stop = min(start + chunk_size, len(x))
+
+        yield start, stop, x[start:stop]
+
+
+def _opp_name(opp) -> str:
+    """Return the serialisable name of an operation.
+
+    Parameters
+    ----------
+    opp : callable
+        NumPy universal function or module-level function.
+
+    Returns
+    -------
+    str, np.ufunc
+        Name of a NumPy universal function, ``module:qualname`` of a function,
+        or the universal function itself if it is not in the NumPy namespace.
+
+    Notes
+    -----
+    Universal functions outside the NumPy namespace, such as those of
+    `scipy.special`, have no ``__module__`` to be named by but pickle by
+    reference themselves.
+    """
+
+    if isinstance(opp, np.ufunc):
+        return opp.__name__ if getattr(np, opp.__name__, None) is opp else opp
+
+    return f"{opp.__module__}:{opp.__qualname__}"
+
+
+def _opp_from_name(name: str):
+    """Return the operation with the given serialisable name.
+
+    Parameters
+    ----------
+    name : str, np.ufunc
+        Name returned by `_opp_name`.
+
+    Returns
+    -------
+    callable
+        NumPy universal function or module-level function.
+    """
+
+    if not isinstance(name, str):
+        return name
+
+    if ":" not in name:
+        return getattr(np, name)
+
+    module, qualname = name.split(":")
+    opp = importlib.import_module(module)
+    for attr in qualname.split("."):
+        opp = getattr(opp, attr)
+
+    return opp
+
+
+def _serialize(inst: list, n: int) -> dict:
+    """Convert instructions to a serialisable expression.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Number of instructions of `inst` belonging to the Stroke.
+
+    Returns
+    -------
+    dict
+        Expression holding the data of each distinct leaf under ``"leaves"``
+        and the instructions under ``"inst"``.
+
+    Notes
+    -----
+    Only instructions the last instruction depends on are kept and they are
+    renumbered consecutively. Operations are stored by name, where they have
+    one, and leaves by the name of their class and the data defining them,
+    so the expression pickles compactly and without references to NumPy or
+    SciPy internals. A leaf instruction stores the index of its data in
+    ``"leaves"``.
+    """
+
+    leaves, leaf_index = [], {}
+    index, out = {}, []
+
+    for i in _order(inst, n - 1):
+
+        opp, a, b, val = inst[i]
+
+        if opp is None:
+            if id(val) not in leaf_index:
+                leaf_index[id(val)] = len(leaves)
+                leaves.append((_opp_name(type(val)), val.__getstate__()))
+            out.append((None, None, None, leaf_index[id(val)]))
+        else:
+            a = None if a is None else index[a]
+            b = None if b is None else index[b]
+            out.append((_opp_name(opp), a, b, val))
+
+        index[i] = len(out) - 1
+
+    return {"leaves": leaves, "inst": out}
+
+
+def _deserialize(state: dict) -> list:
+    """Convert a serialisable expression to instructions.
+
+    Parameters
+    ----------
+    state : dict
+        Expression returned by `_serialize`.
+
+    Returns
+    -------
+    array
+        1D array of instruction arrays.
+    """
+
+    leaves = []
+    for name, leaf_state in state["leaves"]:
+        cls = _opp_from_name(name)
+        leaf = cls.__new__(cls)
+        leaf.__setstate__(leaf_state)
+        leaves.append(leaf)
+
+    inst = []
+    for opp, a, b, val in state["inst"]:
+        if opp is None:
+            inst.append([None, None, None, leaves[val]])
+        else:
+            inst.append([_opp_from_name(opp), a, b, val])
+
+    return inst
+
+
+_WORKER_PLAN = None
+
+
+def _init_worker(stroke) -> None:
+    """Compile the Stroke evaluated by a worker process.
+
+    Parameters
+    ----------
+    stroke : Stroke
+        Stroke shipped to the worker process once.
+    """
+
+    global _WORKER_PLAN
+    _WORKER_PLAN = stroke.compile()
+
+
+def _evaluate_worker(x: np.ndarray, assume_ordered: bool) -> np.ndarray:
+    """Evaluate the worker process's Stroke.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array representing interpolation points.
+    assume_ordered : bool
+        Assumes interpolation points are ordered in increasing order if `True`.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of the evaluated instruction set.
+    """
 
-    return temp
+    return _WORKER_PLAN(x, assume_ordered)
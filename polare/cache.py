@@ -0,0 +1,222 @@
+from collections import OrderedDict
+import numpy as np
+import numpy.typing as npt
+import itertools
+import threading
+import hashlib
+import weakref
+
+
+class ResultCache:
+    """ResultCache(max_bytes=2 ** 28)
+
+    Least recently used cache of instruction results.
+
+    The cache stores the result of every instruction evaluated by Strokes
+    called with it, keyed by the structure of the instruction and a fingerprint
+    of the interpolation points. Strokes sharing leaves and sub-expressions
+    therefore share cache entries. Updating or appending to a leaf drops the
+    results computed from its previous data, and the results computed from a
+    leaf are dropped once it is garbage collected.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the cached results. The least recently used
+        results are evicted first. Default is 256 MiB.
+
+    Attributes
+    ----------
+    hits : int
+        Number of instruction results served from the cache.
+    misses : int
+        Number of instruction results that had to be evaluated.
+    nbytes : int
+        Total size of the cached results.
+
+    Methods
+    -------
+    clear
+
+    Examples
+    --------
+    >>> from polare import ResultCache, Stroke
+    >>> x = np.linspace(-1, 1, 100)
+    >>> s = Stroke(x=x, y=np.exp(x), kind="cubic")
+    >>> cache = ResultCache(max_bytes=2 ** 20)
+    >>> xnew = np.linspace(-1, 1, 1000)
+    >>> y1 = (s + 1)(xnew, cache=cache)
+    >>> y2 = (2 * (s + 1))(xnew, cache=cache)
+    >>> cache.hits
+    1
+    """
+
+    def __init__(self, max_bytes: int=2 ** 28) -> None:
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+        self._entries = OrderedDict()
+        self._ids = {}
+        self._keys = {}
+        self._dependents = {}
+        self._leaves = {}
+        self._fingerprints = {}
+        self._dead = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+
+        with self._lock:
+            for table in (self._entries, self._ids, self._keys, self._dependents, self._leaves,
+                          self._fingerprints):
+                table.clear()
+            self.hits, self.misses, self.nbytes = 0, 0, 0
+
+    def _fingerprint(self, x: npt.ArrayLike, assume_ordered: bool) -> tuple:
+        """Return the fingerprint of the interpolation points.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array or scalar values representing interpolation points.
+        assume_ordered : bool
+            Assumes interpolation points are ordered in increasing order if
+            `True`.
+
+        Returns
+        -------
+        tuple
+            Digest of the values, dtype and shape of `x` and `assume_ordered`.
+        """
+
+        x = np.ascontiguousarray(x)
+        digest = hashlib.blake2b(x.view(np.uint8).reshape(-1), digest_size=16).digest()
+
+        return (digest, x.dtype.str, x.shape, bool(assume_ordered))
+
+    def _node_id(self, key: tuple, leaf=None) -> int:
+        """Return the identifier of an instruction's structure.
+
+        Parameters
+        ----------
+        key : tuple
+            Instruction key whose operands are node identifiers.
+        leaf : Interp, Constant, optional
+            Interpolant of a leaf key.
+
+        Returns
+        -------
+        int
+            Identifier shared by all instructions with the same structure.
+
+        Notes
+        -----
+        Leaf keys hold the version of the leaf's data. A newer version of a
+        leaf makes the identifiers of the older one, and of every instruction
+        depending on it, unreachable, so they are dropped along with their
+        cached results. So are the identifiers of a garbage collected leaf,
+        which is only recorded by its finalizer as the cache may be locked.
+        """
+
+        with self._lock:
+
+            while self._dead:
+                node = self._leaves.pop(self._dead.pop(), None)
+                if node is not None:
+                    self._drop(node)
+
+            node = self._ids.get(key)
+            if node is not None:
+                return node
+
+            node = self._ids[key] = next(self._counter)
+            self._keys[node] = key
+            self._dependents[node] = set()
+
+            if key[0] is None:
+                old = self._leaves.get(key[1])
+                self._leaves[key[1]] = node
+                if old is not None:
+                    self._drop(old)
+                elif leaf is not None:
+                    weakref.finalize(leaf, self._dead.append, key[1])
+            else:
+                for child in key[1:3]:
+                    if child is not None:
+                        self._dependents[child].add(node)
+
+            return node
+
+    def _drop(self, node: int) -> None:
+        """Drop an identifier, its dependents and their cached results."""
+
+        stack = [node]
+
+        while stack:
+
+            node = stack.pop()
+            key = self._keys.pop(node, None)
+            if key is None:
+                continue
+
+            del self._ids[key]
+            stack.extend(self._dependents.pop(node))
+
+            if key[0] is not None:
+                for child in key[1:3]:
+                    if child in self._dependents:
+                        self._dependents[child].discard(node)
+
+            for fingerprint in self._fingerprints.pop(node, ()):
+                self.nbytes -= self._entries.pop((fingerprint, node)).nbytes
+
+    def _get(self, key: tuple):
+        """Return a cached result, or `None` if it is not cached."""
+
+        with self._lock:
+
+            value = self._entries.get(key)
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+            return value
+
+    def _put(self, key: tuple, value: np.ndarray) -> None:
+        """Cache a result, evicting the least recently used results."""
+
+        value = np.asarray(value)
+
+        if value.nbytes > self.max_bytes:
+            return
+
+        value = value.view()
+        value.flags.writeable = False
+
+        with self._lock:
+
+            if key in self._entries or key[1] not in self._keys:
+                return
+
+            self._entries[key] = value
+            self._fingerprints.setdefault(key[1], set()).add(key[0])
+            self.nbytes += value.nbytes
+
+            while self.nbytes > self.max_bytes:
+                (fingerprint, node), old = self._entries.popitem(last=False)
+                self._fingerprints[node].discard(fingerprint)
+                if not self._fingerprints[node]:
+                    del self._fingerprints[node]
+                self.nbytes -= old.nbytes
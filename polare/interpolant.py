@@ -1,12 +1,546 @@
 
 
-from scipy.interpolate import interp1d
+from scipy.interpolate import interp1d, make_interp_spline
 import numpy as np
 import numpy.typing as npt
+import itertools
+import hashlib
+import math
+import weakref
+
+
+_uid = itertools.count()
+_BLOCK = 2 ** 16
+_grids = weakref.WeakValueDictionary()
+
+
+def _as_points(x: npt.ArrayLike, assume_ordered: bool) -> np.ndarray:
+    """Return interpolation points as a read-only 1D view.
+
+    Parameters
+    ----------
+    x : array_like
+        1D array or scalar values representing interpolation points.
+    assume_ordered : bool
+        Assumes interpolation points are ordered in increasing order if `True`.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only 1D view of `x`, which is only copied if it is not already an
+        array.
+
+    Raises
+    ------
+    ValueError
+        If `x` has more than one dimension.
+    UserWarning
+        If `x` is not sorted and `assume_ordered` is `False`.
+    """
+
+    xi = np.asarray(x)
+
+    if xi.ndim == 0:
+        xi = xi.reshape(1)
+    elif xi.ndim != 1:
+        raise ValueError("x should be a scalar or 1D array.")
+
+    xi = xi.view()
+    xi.flags.writeable = False
+
+    if not assume_ordered and not np.all(xi[1:] >= xi[:-1]):
+        raise UserWarning("x is not sorted, output and input array's will not correspond.")
+
+    return xi
+
+
+def _sort_points(x: npt.ArrayLike, assume_ordered: bool) -> tuple:
+    """Return interpolation points in increasing order.
+
+    Parameters
+    ----------
+    x : array_like
+        1D array or scalar values representing interpolation points.
+    assume_ordered : bool
+        Assumes interpolation points are ordered in increasing order if `True`.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only 1D array of the points of `x` in increasing order.
+    np.ndarray, None
+        Permutation sorting `x`, or `None` if `x` is already sorted.
+
+    Raises
+    ------
+    ValueError
+        If `x` has more than one dimension.
+    """
+
+    xi = _as_points(x, True)
+
+    if assume_ordered or np.all(xi[1:] >= xi[:-1]):
+        return xi, None
+
+    order = np.argsort(xi, kind="stable")
+    xi = xi[order]
+    xi.flags.writeable = False
+
+    return xi, order
+
+
+def _unsort(y: np.ndarray, order: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+    """Undo the permutation of interpolation points along the last axis.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Values at the sorted interpolation points.
+    order : np.ndarray, None
+        Permutation returned by `_sort_points`.
+    out : np.ndarray, optional
+        Array to store the result in.
+
+    Returns
+    -------
+    np.ndarray
+        Values at the original interpolation points.
+    """
+
+    if order is None:
+        if out is not None and y is not out:
+            out[...] = y
+            return out
+        return y
+
+    if out is None:
+        out = np.empty_like(y)
+
+    out[..., order] = y
+
+    return out
+
+
+def _check_range(x: np.ndarray, lo: float, hi: float, ordered: bool) -> None:
+    """Check that interpolation points lie within an interval.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of x-coordinates on which to interpolate.
+    lo, hi : float
+        Bounds of the interval.
+    ordered : bool
+        Whether `x` is known to be in increasing order, in which case only
+        its end points are checked.
+
+    Raises
+    ------
+    ValueError
+        If a point lies outside of the interval.
+    """
+
+    if not x.size:
+        return
+
+    xmin, xmax = (x[0], x[-1]) if ordered else (x.min(), x.max())
+
+    if xmin < lo:
+        raise ValueError("A value in x_new is below the interpolation range.")
+    if xmax > hi:
+        raise ValueError("A value in x_new is above the interpolation range.")
+
+
+class _Grid:
+    """_Grid(x)
+
+    Breakpoints shared by piecewise polynomials.
+
+    Interpolants whose pieces join at the same breakpoints share one grid, so
+    the interval holding each interpolation point is located once for all of
+    them.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of increasing breakpoints.
+
+    Methods
+    -------
+    locate
+    locate_point
+    """
+
+    def __init__(self, x: np.ndarray) -> None:
+
+        self._x = x.view()
+        self._x.flags.writeable = False
+        self._inner = self._x[1:-1]
+
+    def locate(self, x: np.ndarray, ordered: bool=False) -> tuple:
+        """Locate interpolation points on the grid.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing x-coordinates on which to interpolate.
+        ordered : bool, optional
+            Whether the order of `x` has been verified, in which case only
+            its end points are checked against the grid.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the interval holding each point, the last interval
+            starting at or before it.
+        np.ndarray
+            Offset of each point from the start of its interval.
+
+        Raises
+        ------
+        ValueError
+            If a point lies outside of the grid.
+        """
+
+        bp = self._x
+
+        _check_range(x, bp[0], bp[-1], ordered)
+
+        idx = self._inner.searchsorted(x, "right")
+
+        return idx, x - bp.take(idx)
+
+    def locate_point(self, x: float) -> tuple:
+        """Locate a single interpolation point on the grid.
+
+        Parameters
+        ----------
+        x : float
+            x-coordinate on which to interpolate.
+
+        Returns
+        -------
+        int
+            Index of the interval holding the point.
+        float
+            Offset of the point from the start of its interval.
+
+        Raises
+        ------
+        ValueError
+            If the point lies outside of the grid.
+        """
+
+        bp = self._x
+
+        if x < bp[0]:
+            raise ValueError("A value in x_new is below the interpolation range.")
+        if x > bp[-1]:
+            raise ValueError("A value in x_new is above the interpolation range.")
+
+        i = int(self._inner.searchsorted(x, "right"))
+
+        return i, x - bp[i]
+
+
+class _UniformGrid:
+    """_UniformGrid(x0, x1, n)
+
+    Uniformly spaced breakpoints shared by piecewise polynomials.
+
+    The breakpoints are those of ``np.linspace(x0, x1, n)``. Only the end
+    points and the number of breakpoints are stored, and the interval holding
+    each interpolation point is computed arithmetically instead of searched
+    for.
+
+    Parameters
+    ----------
+    x0, x1 : float
+        First and last breakpoints.
+    n : int
+        Number of breakpoints.
+
+    Methods
+    -------
+    locate
+    locate_point
+    """
+
+    def __init__(self, x0: float, x1: float, n: int) -> None:
+
+        self._x0, self._x1, self._n = x0, x1, n
+        self._step = (x1 - x0) / (n - 1)
+
+    def locate(self, x: np.ndarray, ordered: bool=False) -> tuple:
+        """Locate interpolation points on the grid.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing x-coordinates on which to interpolate.
+        ordered : bool, optional
+            Whether the order of `x` has been verified, in which case only
+            its end points are checked against the grid.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the interval holding each point.
+        np.ndarray
+            Offset of each point from the start of its interval.
+
+        Raises
+        ------
+        ValueError
+            If a point lies outside of the grid.
+        """
+
+        _check_range(x, self._x0, self._x1, ordered)
+
+        pos = x - self._x0
+        pos /= self._step
+
+        idx = pos.astype(np.intp)
+        np.minimum(idx, self._n - 2, out=idx)
+
+        pos -= idx
+        pos *= self._step
+
+        return idx, pos
+
+    def locate_point(self, x: float) -> tuple:
+        """Locate a single interpolation point on the grid.
+
+        Parameters
+        ----------
+        x : float
+            x-coordinate on which to interpolate.
+
+        Returns
+        -------
+        int
+            Index of the interval holding the point.
+        float
+            Offset of the point from the start of its interval.
+
+        Raises
+        ------
+        ValueError
+            If the point lies outside of the grid.
+        """
+
+        if x < self._x0:
+            raise ValueError("A value in x_new is below the interpolation range.")
+        if x > self._x1:
+            raise ValueError("A value in x_new is above the interpolation range.")
+
+        pos = (x - self._x0) / self._step
+        i = min(int(pos), self._n - 2) if pos == pos else 0
+
+        return i, (pos - i) * self._step
+
+
+def _sort_order(x: np.ndarray) -> np.ndarray:
+    """Return the order sorting data point coordinates.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of data point coordinates.
+
+    Returns
+    -------
+    np.ndarray, None
+        Indices of the stable sort of `x`, or `None` if `x` is already in
+        increasing order.
+    """
+
+    if np.any(x[1:] < x[:-1]):
+        return np.argsort(x, kind="stable")
+
+    return None
+
+
+def _data(x: npt.ArrayLike, y: npt.ArrayLike, uniform: bool=None) -> tuple:
+    """Return data points as arrays sorted by their coordinates.
+
+    Parameters
+    ----------
+    x : array_like
+        1D array of data point coordinates.
+    y : array_like
+        Array of function outputs along its last axis.
+    uniform : bool, optional
+        Whether `x` is uniformly spaced. Detected if `None`, in which case `x`
+        is uniform if it equals the ``np.linspace`` between its end points.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of increasing data point coordinates, which is the
+        ``np.linspace`` between the end points of `x` if it is uniform.
+    np.ndarray
+        Array of inexact function outputs along its last axis.
+    bool
+        Whether `x` is uniformly spaced.
+    np.ndarray, None
+        Order sorting the given data points, or `None` if they were sorted.
+
+    Raises
+    ------
+    ValueError
+        If `x` is not 1D, its length differs from that of `y` or it is not
+        uniformly spaced while `uniform` is `True`.
+    """
+
+    x, y = np.array(x), np.array(y)
+
+    if x.ndim != 1:
+        raise ValueError("the x array must have exactly one dimension.")
+    if y.ndim == 0 or y.shape[-1] != len(x):
+        raise ValueError("x and y arrays must be equal in length along interpolation axis.")
+    if len(x) < 2:
+        raise ValueError("x and y arrays must have at least 2 entries")
+
+    if not np.issubdtype(y.dtype, np.inexact):
+        y = y.astype(np.float64)
+
+    order = _sort_order(x)
+    if order is not None:
+        x, y = x[order], y[..., order]
+
+    if uniform is False or not x[-1] > x[0]:
+        if uniform:
+            raise ValueError("x is not uniformly spaced.")
+        return x, y, False, order
+
+    grid = np.linspace(x[0], x[-1], len(x))
+
+    if uniform is None:
+        return (grid, y, True, order) if np.array_equal(x, grid) else (x, y, False, order)
+
+    if not np.allclose(x, grid, rtol=0, atol=1e-6 * (grid[1] - grid[0])):
+        raise ValueError("x is not uniformly spaced.")
+
+    return grid, y, True, order
+
+
+def _grid(x: np.ndarray) -> _Grid:
+    """Return the grid of the breakpoints `x`, shared by all its users.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of increasing breakpoints.
+
+    Returns
+    -------
+    _Grid
+        Grid of the breakpoints, which is the same object for all live
+        interpolants with equal breakpoints.
+    """
+
+    x = np.ascontiguousarray(x)
+    key = (x.dtype.str, hashlib.blake2b(x.view(np.uint8), digest_size=16).digest())
+
+    grid = _grids.get(key)
+    if grid is None:
+        grid = _grids[key] = _Grid(x)
+
+    return grid
+
+
+def _uniform_grid(x0: float, x1: float, n: int) -> _UniformGrid:
+    """Return the uniform grid of ``np.linspace(x0, x1, n)``, shared by all
+    its users.
+
+    Parameters
+    ----------
+    x0, x1 : float
+        First and last breakpoints.
+    n : int
+        Number of breakpoints.
+
+    Returns
+    -------
+    _UniformGrid
+        Grid of the breakpoints, which is the same object for all live
+        interpolants with equal breakpoints.
+    """
+
+    key = (float(x0), float(x1), int(n))
+
+    grid = _grids.get(key)
+    if grid is None:
+        grid = _grids[key] = _UniformGrid(*key)
+
+    return grid
+
+
+_DEGREES = {"linear": 1, "quadratic": 2, "cubic": 3}
+
+
+def _coefficients(x: np.ndarray, y: np.ndarray, kind: str, uniform: bool=False) -> tuple:
+    """Return the piecewise polynomial interpolating data points.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of increasing data point coordinates.
+    y : np.ndarray
+        Array of function outputs along its last axis.
+    kind : {"linear", "quadratic", "cubic"}
+        The order of the interpolant.
+    uniform : bool, optional
+        Whether `x` is the ``np.linspace`` between its end points.
+
+    Returns
+    -------
+    _Grid, _UniformGrid
+        Breakpoints of the pieces.
+    np.ndarray
+        Array of shape ``(d+1, m)`` holding the coefficients of the ``m``
+        pieces in decreasing powers of the offset from their breakpoint.
+
+    Notes
+    -----
+    The end pieces of quadratic and cubic splines span several data points,
+    so on uniform data the pieces are split at uniformly spaced breakpoints
+    instead: the data points for a cubic, and the data points and the
+    quadratic's knots midway between them for a quadratic. The coefficients
+    of each piece are expanded from the midpoint of the piece, which cannot
+    round onto a neighbouring piece.
+
+    Linear pieces between duplicate data points are constant at the value of
+    the later point, which is where ``np.interp`` evaluates such points.
+    """
+
+    if kind == "linear":
+        h = np.diff(x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = np.stack([np.diff(y) / h, y[..., :-1]])
+        if not np.all(h):
+            c[..., h == 0] = np.stack([np.zeros_like(y[..., 1:]), y[..., 1:]])[..., h == 0]
+    else:
+        k = _DEGREES[kind]
+        spline = make_interp_spline(x, y, k=k, axis=-1, check_finite=False)
+        if uniform:
+            x = np.linspace(x[0], x[-1], (len(x) - 1) * (2 - k % 2) + 1)
+        else:
+            x = spline.t[k:len(spline.t) - k]
+        mid = (x[:-1] + x[1:]) / 2
+        d = [spline(mid, nu=i) / math.factorial(i) for i in range(k + 1)]
+        h = x[:-1] - mid
+        c = np.stack([sum(math.comb(i, r) * d[i] * h ** (i - r) for i in range(r, k + 1))
+                      for r in range(k, -1, -1)])
+
+    grid = _uniform_grid(x[0], x[-1], len(x)) if uniform else _grid(x)
+
+    return grid, np.ascontiguousarray(c)
 
 
 class Interp:
-    """Interp(x, y, kind="linear")
+    """Interp(x, y, kind="linear", backend="polare")
 
     Interpolate 1-D array.
 
@@ -20,27 +554,68 @@ class Interp:
         Arrays defining the data point coordinates and function outputs.
 
         The data in `x` define the independent variable; the data in `y`
-        define the dependent variable.
+        define the dependent variable. `y` may have leading channel axes, in
+        which case every channel is interpolated in one call.
     kind : {"linear", "quadratic", "cubic"}, optional
         The order of interpolation to use. Default is 'linear'.
+    backend : {"polare", "scipy"}, optional
+        Implementation of the interpolant. "polare" stores the coefficients of
+        the interpolating piecewise polynomial and evaluates it directly,
+        while "scipy" evaluates through `scipy.interpolate.interp1d`. Default
+        is 'polare'.
+    uniform : bool, optional
+        Whether `x` is uniformly spaced, for the "polare" backend. Detected if
+        `None`, the default, as `x` equal to the ``np.linspace`` between its
+        end points. If `True`, `x` is taken to be that ``np.linspace``.
 
     Attributes
     ----------
-    _f : interp1d
-        The interpolation callable.
+    _f : interp1d, None
+        The interpolation callable of the "scipy" backend.
     _kind : {"linear", "quadratic", "cubic"}
         The order of the interpolant.
+    _x, _y : np.ndarray
+        The data points, sorted by `x`. `_x` is `None` if `x` is uniformly
+        spaced, except for single channel linear interpolants.
+    _span : tuple, None
+        First and last data point coordinates and number of data points if
+        `x` is uniformly spaced.
+    _grid : _Grid, _UniformGrid, None
+        Breakpoints of the interpolant's pieces for the "polare" backend.
+    _c : np.ndarray, None
+        Coefficients of the interpolant's pieces for the "polare" backend,
+        computed on first use for single channel linear interpolants.
+    _perm : np.ndarray, None
+        Order sorting the data points as given, or `None` if they were
+        sorted.
+    _uid : int
+        Identifier unique to the interpolant within the process.
+    _version : int
+        Number of times the data of the interpolant has been updated.
 
     Methods
     -------
     __call__
 
+    Raises
+    ------
+    ValueError
+        If `kind` or `backend` is not supported, or `uniform` is `True` and
+        `x` is not uniformly spaced.
+
     Notes
     -----
     The minimum number of data points required is ``d+1``, with ``d`` being the
     interpolant degree. If this condition is not satisfied, the degree will be
     set to ``n-1``, with ``n`` being the number of data points.
 
+    The "polare" backend evaluates each point with one binary search and a
+    Horner scheme over the coefficients of its piece. Interpolants fitted to
+    the same `x` share their grid, so Strokes evaluating several of them
+    locate each interpolation point once per grid. On uniformly spaced `x`
+    only the end points and size of `x` are kept, and the interval holding an
+    interpolation point is computed rather than searched for.
+
     Examples
     --------
     Construct a 1-D array and `Interp` object:
@@ -59,10 +634,110 @@ class Interp:
     >>> plt.show()
     """
 
-    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike, kind: str) -> None:
+    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike, kind: str="linear",
+                 backend: str="polare", uniform: bool=None) -> None:
+
+        if kind not in _DEGREES:
+            raise ValueError(f"kind should be one of {', '.join(_DEGREES)}.")
 
-        self._f = interp1d(x, y, kind)
         self._kind = kind
+        self._uid = next(_uid)
+        self._version = 0
+        self._span = None
+
+        if backend == "scipy":
+            self._f = interp1d(x, y, kind)
+            self._x, self._y = self._f.x, self._f.y
+            self._grid, self._c = None, None
+            self._perm = _sort_order(np.asarray(x))
+        elif backend == "polare":
+            self._f = None
+            x, self._y, uniform, self._perm = _data(x, y, uniform)
+            if self._linear:
+                self._grid = _uniform_grid(x[0], x[-1], len(x)) if uniform else _grid(x)
+                self._c = None
+            else:
+                self._grid, self._c = _coefficients(x, self._y, kind, uniform)
+            self._x = x
+            if uniform:
+                self._span = (x[0], x[-1], len(x))
+                if not self._linear:
+                    self._x = None
+        else:
+            raise ValueError("backend should be 'polare' or 'scipy'.")
+
+    def __getstate__(self) -> dict:
+        """Return the data defining the interpolant.
+
+        Returns
+        -------
+        dict
+            Data point coordinates, function outputs, interpolant order and
+            backend.
+        """
+
+        backend = "polare" if self._f is None else "scipy"
+        x = np.linspace(*self._span) if self._x is None else self._x
+        y = self._y
+
+        if self._perm is not None:
+            x, y = _unsort(x, self._perm), _unsort(y, self._perm)
+
+        return {"x": x, "y": y, "kind": self._kind, "backend": backend}
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild the interpolant from its defining data.
+
+        Parameters
+        ----------
+        state : dict
+            Data point coordinates, function outputs, interpolant order and
+            backend.
+        """
+
+        self.__init__(state["x"], state["y"], state["kind"], state.get("backend", "scipy"))
+
+    def _update(self, y: npt.ArrayLike) -> None:
+        """Replace the function outputs at the data points.
+
+        Parameters
+        ----------
+        y : array_like
+            Array of function outputs of the shape of the current ones, in the
+            order of the data points the interpolant was constructed with.
+
+        Raises
+        ------
+        ValueError
+            If the shape of `y` differs from that of the current outputs.
+
+        Notes
+        -----
+        Only the coefficients are refitted; the data point coordinates, and
+        with them the grid, are kept. `_version` is incremented so results
+        cached for the previous outputs are no longer looked up.
+        """
+
+        y = np.array(y)
+
+        if y.shape != self._y.shape:
+            raise ValueError("y must have the shape of the data it replaces.")
+        if not np.issubdtype(y.dtype, np.inexact):
+            y = y.astype(np.float64)
+        if self._perm is not None:
+            y = y[..., self._perm]
+
+        if self._f is not None:
+            self._f = interp1d(self._x, y, self._kind, assume_sorted=True)
+            self._y = self._f.y
+        elif self._linear:
+            self._y, self._c = y, None
+        else:
+            x = np.linspace(*self._span) if self._x is None else self._x
+            self._y = y
+            self._c = _coefficients(x, y, self._kind, self._span is not None)[1]
+
+        self._version += 1
 
     def __call__(self, x: npt.ArrayLike, assume_ordered: bool=False) -> np.ndarray:
         """Interpolate the function.
@@ -81,17 +756,574 @@ class Interp:
             1D array representing the interpolated values.
         """
 
-        xi = np.array(x, copy=True)
+        return self._call(_as_points(x, assume_ordered), not assume_ordered)
+
+    def _call(self, x: np.ndarray, ordered: bool) -> np.ndarray:
+        """Interpolate the function at validated interpolation points.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing x-coordinates on which to interpolate.
+        ordered : bool
+            Whether the order of `x` has been verified, in which case only
+            its end points are checked against the data.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array representing the interpolated values.
+        """
+
+        if self._f is not None:
+            return self._f(x)
+
+        if self._linear:
+            return self._interp(x, ordered)
+
+        return self._at(*self._grid.locate(x, ordered))
+
+    def _scalar(self, x: float):
+        """Interpolate the function at a single point.
+
+        Parameters
+        ----------
+        x : float
+            x-coordinate on which to interpolate.
+
+        Returns
+        -------
+        float, np.ndarray
+            Interpolated value, or values of each channel.
+
+        Raises
+        ------
+        ValueError
+            If the point lies outside of the data.
+        """
+
+        if self._f is not None:
+            return self._f(x)[()]
+
+        if self._linear:
+
+            xp, fp = self._x, self._y
+
+            if x < xp[0]:
+                raise ValueError("A value in x_new is below the interpolation range.")
+            if x > xp[-1]:
+                raise ValueError("A value in x_new is above the interpolation range.")
+            if x == xp[-1]:
+                return fp[-1]
+
+            j = min(max(int(xp.searchsorted(x, "right")) - 1, 0), len(xp) - 2)
+
+            return (fp[j + 1] - fp[j]) / (xp[j + 1] - xp[j]) * (x - xp[j]) + fp[j]
+
+        i, dx = self._grid.locate_point(x)
+
+        c = self._c
+        if c is None:
+            c = self._c = _coefficients(self._x, self._y, self._kind)[1]
+
+        c = c[..., i]
+
+        y = c[0]
+        for ci in c[1:]:
+            y = y * dx + ci
+
+        return y
+
+    @property
+    def _linear(self) -> bool:
+        """Whether the interpolant is evaluated with the linear kernel."""
+
+        return self._f is None and self._kind == "linear" and self._y.ndim == 1
+
+    def _interp(self, x: np.ndarray, ordered: bool=False) -> np.ndarray:
+        """Interpolate a single channel linear interpolant.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing x-coordinates on which to interpolate.
+        ordered : bool, optional
+            Whether the order of `x` has been verified, in which case only
+            its end points are checked against the data.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array representing the interpolated values.
+
+        Raises
+        ------
+        ValueError
+            If a point lies outside of the data.
+
+        Notes
+        -----
+        `np.interp` walks sorted points from interval to interval rather than
+        searching for each of them, and allocates nothing but its result.
+        """
+
+        xp = self._x
+
+        _check_range(x, xp[0], xp[-1], ordered)
+
+        return np.interp(x, xp, self._y)
+
+    def _at(self, idx: np.ndarray, dx: np.ndarray) -> np.ndarray:
+        """Interpolate the function at located points.
+
+        Parameters
+        ----------
+        idx, dx : np.ndarray
+            Interval indices and offsets returned by ``self._grid.locate``.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array representing the interpolated values.
+
+        Notes
+        -----
+        The channels of a multi-channel interpolant are evaluated in blocks of
+        about `_BLOCK` values so the Horner scheme runs on cache resident
+        data.
+        """
+
+        c = self._c
+        if c is None:
+            c = self._c = _coefficients(self._x, self._y, self._kind)[1]
+
+        if c.ndim == 2:
+            y = np.take(c[0], idx, mode="clip")
+            for ci in c[1:]:
+                y *= dx
+                y += np.take(ci, idx, mode="clip")
+            return y
+
+        m = len(dx)
+
+        y = np.empty(c.shape[1:-1] + (m,), dtype=np.result_type(c, dx))
+
+        rows = c.reshape(len(c), -1, c.shape[-1])
+        out = y.reshape(rows.shape[1], m)
+        block = max(1, _BLOCK // max(1, m))
+        tmp = np.empty((min(block, len(out)), m), dtype=y.dtype)
+
+        for r in range(0, len(out), block):
+
+            yb = out[r:r + block]
+            tb = tmp[:len(yb)]
+
+            np.take(rows[0, r:r + block], idx, axis=-1, out=yb, mode="clip")
+            for ci in rows[1:]:
+                yb *= dx
+                np.take(ci[r:r + block], idx, axis=-1, out=tb, mode="clip")
+                yb += tb
+
+        return y
+
+
+def _stream_coefficients(x: np.ndarray, y: np.ndarray, kind: str) -> np.ndarray:
+    """Return the coefficients of a local piecewise polynomial interpolant.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1D array of at least two increasing data point coordinates.
+    y : np.ndarray
+        Array of function outputs along its last axis.
+    kind : {"linear", "quadratic", "cubic"}
+        The order of the interpolant.
+
+    Returns
+    -------
+    np.ndarray
+        Coefficients of shape ``(d+1, *channels, len(x)-1)`` of the pieces
+        between consecutive data points, highest power first and in powers of
+        the offset from the start of the piece.
+
+    Notes
+    -----
+    Quadratic and cubic interpolants are cubic Hermite splines whose slope at
+    each data point is that of the parabola through it and its neighbours,
+    one-sided at the end points. A piece therefore only depends on the data
+    points up to one beyond its ends, and reproduces quadratics exactly.
+    """
+
+    h = np.diff(x)
+    delta = np.diff(y, axis=-1) / h
+
+    if kind == "linear":
+        return np.stack([delta, y[..., :-1]])
+
+    d = np.empty_like(y, dtype=delta.dtype)
+
+    if len(h) == 1:
+        d[...] = delta
+    else:
+        h0, h1 = h[:-1], h[1:]
+        d[..., 1:-1] = (h1 * delta[..., :-1] + h0 * delta[..., 1:]) / (h0 + h1)
+        d[..., 0] = ((2 * h[0] + h[1]) * delta[..., 0] - h[0] * delta[..., 1]) / (h[0] + h[1])
+        d[..., -1] = ((2 * h[-1] + h[-2]) * delta[..., -1] - h[-1] * delta[..., -2]) / (h[-1] + h[-2])
+
+    d0, d1 = d[..., :-1], d[..., 1:]
+
+    return np.stack([(d0 + d1 - 2 * delta) / h ** 2, (3 * delta - 2 * d0 - d1) / h, d0, y[..., :-1]])
+
+
+class Stream(Interp):
+    """Stream(x, y, kind="linear", window=None)
+
+    Interpolate 1-D array with data points appended over time.
+
+    This class returns a function like `Interp` whose data can be extended
+    with points beyond its last one, as they arrive from a live source.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Arrays defining the initial data point coordinates and function
+        outputs, with `y` optionally holding leading channel axes.
+    kind : {"linear", "quadratic", "cubic"}, optional
+        The order of interpolation to use. Default is 'linear'.
+    window : int, optional
+        Number of most recent data points kept. All data points are kept if
+        `None`, the default.
+
+    Attributes
+    ----------
+    _x, _y, _c : np.ndarray
+        Views of the data points and piece coefficients held in the buffers.
+    _window : int, None
+        Number of most recent data points kept.
+
+    Methods
+    -------
+    __call__
+
+    Raises
+    ------
+    ValueError
+        If `kind` is not supported, `window` is less than 2 or `x` holds
+        duplicate coordinates.
+
+    Notes
+    -----
+    Data points and coefficients live in buffers with spare capacity at their
+    end. Appending writes into the spare capacity and refits the pieces
+    whose neighbourhood changed, the last piece and the new ones, so its cost
+    does not depend on the number of data points. Full buffers are replaced
+    by ones holding twice the kept data points, and data points dropped out
+    of the window are discarded then, so appends take amortised constant time.
+
+    Quadratic and cubic interpolants are local cubic Hermite splines rather
+    than the global splines of `Interp`, since a global spline has to be
+    refitted entirely whenever a data point is added. Their values differ
+    from those of `Interp` by the interpolation error.
+
+    The knots change with every append, so streams do not share grids with
+    other interpolants and are located on their own data points.
+    """
+
+    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike, kind: str="linear",
+                 window: int=None) -> None:
+
+        if kind not in _DEGREES:
+            raise ValueError(f"kind should be one of {', '.join(_DEGREES)}.")
+        if window is not None and window < 2:
+            raise ValueError("window should be at least 2.")
+
+        self._kind = kind
+        self._uid = next(_uid)
+        self._version = 0
+        self._window = window
+        self._f, self._grid, self._span, self._perm = None, None, None, None
+
+        x, y, _, _ = _data(x, y, False)
+
+        if not np.issubdtype(x.dtype, np.inexact):
+            x = x.astype(np.float64)
+        if np.any(x[1:] == x[:-1]):
+            raise ValueError("x must not hold duplicate coordinates.")
+
+        self._reset(x, y)
+
+    def _reset(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Replace all data points.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing data point coordinates.
+        y : np.ndarray
+            Array of function outputs along its last axis.
+        """
+
+        if self._window is not None:
+            x, y = x[-self._window:], y[..., -self._window:]
+
+        n = len(x)
+        d = 1 if self._kind == "linear" else 3
+
+        self._xb = np.empty(2 * n, dtype=x.dtype)
+        self._yb = np.empty(y.shape[:-1] + (2 * n,), dtype=y.dtype)
+        self._cb = np.empty((d + 1,) + self._yb.shape, dtype=np.result_type(x, y))
+
+        self._xb[:n], self._yb[..., :n] = x, y
+        self._lo, self._hi = 0, n
+
+        self._views()
+        self._refit(0, n - 1)
+
+    def _views(self) -> None:
+        """Point the data point and coefficient views at the kept data."""
+
+        lo, hi = self._lo, self._hi
+
+        self._x, self._y, self._c = self._xb[lo:hi], self._yb[..., lo:hi], self._cb[..., lo:hi - 1]
+
+    def _refit(self, start: int, stop: int) -> None:
+        """Refit the pieces of buffer indices `start` to `stop`."""
+
+        if start >= stop:
+            return
+
+        a, b = max(self._lo, start - 1), min(self._hi, stop + 2)
+        c = _stream_coefficients(self._xb[a:b], self._yb[..., a:b], self._kind)
+
+        self._cb[..., start:stop] = c[..., start - a:stop - a]
+
+    def _append(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        """Append data points.
+
+        Parameters
+        ----------
+        x : array_like
+            Scalar or 1D array of increasing data point coordinates, all
+            beyond the last data point.
+        y : array_like
+            Function outputs at `x`, with the channel axes of the data first.
+
+        Raises
+        ------
+        ValueError
+            If the shapes of `x` and `y` do not match the data or `x` does not
+            increase beyond the last data point.
+        """
+
+        x = np.asarray(x, dtype=self._xb.dtype)
+        y = np.asarray(y)
+
+        if x.ndim == 0:
+            x, y = x[None], y[..., None]
+        if x.ndim != 1 or y.shape != self._yb.shape[:-1] + x.shape:
+            raise ValueError("x and y arrays must be equal in length along interpolation axis.")
+        if not x.size:
+            return
+        if not x[0] > self._x[-1] or np.any(x[1:] <= x[:-1]):
+            raise ValueError("appended x must increase beyond the last data point.")
+
+        k, window = len(x), self._window
+
+        if window is not None and k >= window:
+            self._reset(x, y)
+            self._version += 1
+            return
+
+        lo, hi = self._lo, self._hi
+        if window is not None:
+            lo = max(lo, hi + k - window)
+
+        dropped = lo != self._lo
+
+        if hi + k > len(self._xb):
+
+            n = hi - lo
+            size = max(len(self._xb), 2 * (n + k))
+
+            xb = np.empty(size, dtype=self._xb.dtype)
+            yb = np.empty(self._yb.shape[:-1] + (size,), dtype=self._yb.dtype)
+            cb = np.empty(self._cb.shape[:-1] + (size,), dtype=self._cb.dtype)
+
+            xb[:n], yb[..., :n], cb[..., :n - 1] = self._xb[lo:hi], self._yb[..., lo:hi], self._cb[..., lo:hi - 1]
+            self._xb, self._yb, self._cb = xb, yb, cb
+
+            lo, hi = 0, n
+
+        self._xb[hi:hi + k], self._yb[..., hi:hi + k] = x, y
+        self._lo, self._hi = lo, hi + k
+
+        self._views()
+        self._refit(max(lo, hi - 2), hi + k - 1)
+        if dropped:
+            self._refit(lo, lo + 1)
+
+        self._version += 1
+
+    def _update(self, y: npt.ArrayLike) -> None:
+        """Replace the function outputs at the kept data points.
+
+        Parameters
+        ----------
+        y : array_like
+            Array of function outputs of the shape of the current ones.
+
+        Raises
+        ------
+        ValueError
+            If the shape of `y` differs from that of the current outputs.
+        """
+
+        y = np.asarray(y)
+
+        if y.shape != self._y.shape:
+            raise ValueError("y must have the shape of the data it replaces.")
+
+        self._y[...] = y
+        self._refit(self._lo, self._hi - 1)
+        self._version += 1
+
+    def __getstate__(self) -> dict:
+        """Return the data defining the interpolant.
+
+        Returns
+        -------
+        dict
+            Kept data point coordinates and function outputs, interpolant
+            order and window.
+        """
+
+        return {"x": self._x.copy(), "y": self._y.copy(), "kind": self._kind, "window": self._window}
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild the interpolant from its defining data.
+
+        Parameters
+        ----------
+        state : dict
+            Kept data point coordinates and function outputs, interpolant
+            order and window.
+        """
+
+        self.__init__(state["x"], state["y"], state["kind"], state["window"])
+
+    def _call(self, x: np.ndarray, ordered: bool) -> np.ndarray:
+        """Interpolate the function at validated interpolation points.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of increasing x-coordinates on which to interpolate.
+        ordered : bool
+            Whether the order of `x` has been verified, in which case only
+            its end points are checked against the data.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array representing the interpolated values.
+        """
+
+        if self._linear:
+            return self._interp(x, ordered)
+
+        return self._at(*_Grid(self._x).locate(x, ordered))
+
+    def _scalar(self, x: float):
+        """Interpolate the function at a single point.
+
+        Parameters
+        ----------
+        x : float
+            x-coordinate on which to interpolate.
+
+        Returns
+        -------
+        float, np.ndarray
+            Interpolated value, or values of each channel.
+
+        Raises
+        ------
+        ValueError
+            If the point lies outside of the data.
+        """
+
+        if self._linear:
+            return super()._scalar(x)
+
+        i, dx = _Grid(self._x).locate_point(x)
+        c = self._c[..., i]
+
+        y = c[0]
+        for ci in c[1:]:
+            y = y * dx + ci
+
+        return y
+
+
+class Constant:
+    """Constant(value)
+
+    Constant function.
+
+    This class returns a function whose call method gives `value` at every
+    point. It stands in for interpolants in Strokes whose expression has been
+    simplified to a constant.
+
+    Parameters
+    ----------
+    value : int, float
+        Value of the function.
+
+    Methods
+    -------
+    __call__
+    """
+
+    def __init__(self, value: float) -> None:
+
+        self._value = value
+        self._uid = next(_uid)
+        self._version = 0
+
+    def _scalar(self, x: float):
+        """Evaluate the function at a single point."""
+
+        return np.asarray(self._value)[()]
+
+    def __call__(self, x: npt.ArrayLike, assume_ordered: bool=False) -> np.ndarray:
+        """Evaluate the function.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array representing the x-coordinates on which to evaluate.
+        assume_ordered : bool, optional
+            Unused, present for compatibility with `Interp`.
+
+        Returns
+        -------
+        y : array_like
+            1D array holding `value` for every point of `x`.
+        """
+
+        return np.full(np.size(x), self._value)
+
+    def _call(self, x: np.ndarray, ordered: bool) -> np.ndarray:
+        """Evaluate the function at validated interpolation points."""
+
+        return np.full(x.size, self._value)
+
+    def __getstate__(self) -> dict:
+        """Return the value of the function."""
 
-        if xi.ndim == 0:
-            xi = np.array([x], copy=True)
-        elif xi.ndim != 1:
-            raise ValueError("x should be a scalar or 1D array.")
+        return {"value": self._value}
 
-        if not assume_ordered:
-            test_xi = np.copy(xi)
-            xi = np.sort(xi, kind="quicksort")
-            if not np.all(test_xi == xi):
-                raise UserWarning("x is not sorted, output and input array's will not correspond.")
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild the function from its value."""
 
-        return self._f(xi)
+        self.__init__(state["value"])
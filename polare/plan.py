@@ -0,0 +1,330 @@
+from polare.interpolant import _sort_points, _unsort
+from polare._stroke_utils import _evaluate, _order, _shared_grids
+import numpy as np
+import numpy.typing as npt
+
+
+def _pooled(opp) -> bool:
+    """Whether the result of an operation can be written to a pooled buffer."""
+
+    return isinstance(opp, np.ufunc) and opp.nout == 1
+
+
+class Plan:
+    """Plan(inst, n)
+
+    Compiled evaluation plan of a Stroke.
+
+    A plan evaluates the same instructions as the Stroke it was compiled from
+    but writes intermediate results into a small pool of reusable buffers
+    instead of allocating a new array per instruction.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Number of instructions of `inst` belonging to the Stroke.
+
+    Attributes
+    ----------
+    buffers : int
+        Number of buffers currently held by the pool.
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    A liveness analysis records, for each instruction, the operands whose last
+    use it is. Their buffers return to the pool before the instruction's result
+    is allocated, so an elementwise ufunc may write its result over a dying
+    operand. The pool therefore holds as many buffers as there are
+    simultaneously live intermediates rather than one per instruction.
+
+    Operations other than single output ufuncs, such as channel selection,
+    may return views of their operands. The buffers of such operands are
+    kept until the views die, and operands of which the result may be a view
+    are not given buffers at all.
+
+    Unsorted interpolation points are sorted once per call and the result
+    is permuted back to their order.
+
+    Buffers persist between calls with query arrays of the same length, so a
+    plan must not be called concurrently from several threads. The result
+    types and shapes the buffers are sized by are determined again after the
+    data of a leaf is updated.
+
+    Examples
+    --------
+    >>> from polare import Stroke
+    >>> x = np.linspace(-1, 1, 100)
+    >>> s = Stroke(x=x, y=np.exp(x), kind="cubic")
+    >>> plan = (4 * (s + 2) - s / 3).compile()
+    >>> ynew = plan(np.linspace(-1, 1, 10 ** 6))
+    """
+
+    def __init__(self, inst: list, n: int) -> None:
+
+        self._inst = inst[:n]
+        self._n = n
+        self._order = _order(self._inst, n - 1)
+        self._grids = _shared_grids(self._inst, self._order)
+
+        last = {}
+        for i in self._order:
+            for j in self._inst[i][1:3]:
+                if j is not None:
+                    last[j] = i
+
+        position = {i: k for k, i in enumerate(self._order)}
+        self._escaping = {n - 1}
+
+        for i in reversed(self._order):
+            opp = self._inst[i][0]
+            if opp is None or _pooled(opp):
+                continue
+            for j in self._inst[i][1:3]:
+                if j is None:
+                    continue
+                if i in self._escaping:
+                    self._escaping.add(j)
+                elif position[last[i]] > position[last[j]]:
+                    last[j] = last[i]
+
+        self._dying = {i: [] for i in self._order}
+        for j, i in last.items():
+            if j not in self._dying[i]:
+                self._dying[i].append(j)
+
+        self._leaves = [self._inst[i][3] for i in self._order if self._inst[i][0] is None]
+        self._versions = None
+
+        self._meta = {}
+        self._pool = {}
+
+    @property
+    def buffers(self) -> int:
+        """Number of buffers currently held by the pool."""
+
+        return sum(len(pool) for pool in self._pool.values())
+
+    def __call__(self, x: npt.ArrayLike, assume_ordered: bool=False,
+                 out: np.ndarray=None) -> np.ndarray:
+        """Interpolate the function.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array of x-coordinates on which to interpolate.
+        assume_ordered : bool, optional
+            Assumes interpolation points are ordered in increasing order if
+            `True`.
+        out : np.ndarray, optional
+            Array to store the result in.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array of the interpolated values.
+        """
+
+        x, order = _sort_points(x, assume_ordered)
+        m, ordered = x.size, not assume_ordered
+
+        if m == 0:
+            return self._run(x, ordered, None, out)
+
+        if order is not None:
+            return _unsort(self._call(x, m, None, ordered), order, out)
+
+        return self._call(x, m, out, ordered)
+
+    def _call(self, x, m, out, ordered):
+        """Execute the plan on sorted interpolation points of length `m`."""
+
+        versions = [leaf._version for leaf in self._leaves]
+        if versions != self._versions:
+            self._meta.clear()
+            self._versions = versions
+
+        self._pool = {key: pool for key, pool in self._pool.items() if key[1][-1] == m}
+
+        if x.dtype not in self._meta:
+            probe = self._run(x[:1], True, None, None, keep=True)
+            self._meta[x.dtype] = {i: (np.result_type(probe[i]), np.shape(probe[i])[:-1])
+                                   for i in self._order}
+
+        return self._run(x, ordered, self._meta[x.dtype], out, m=m)
+
+    def _run(self, x, ordered, meta, out, keep=False, m=0):
+        """Execute the plan.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            1D array of x-coordinates on which to interpolate.
+        ordered : bool
+            Whether the order of `x` has been verified, in which case leaves
+            only check its end points against their data.
+        meta : dict
+            Result dtype and leading shape of each instruction, or `None` to
+            evaluate without buffers.
+        out : np.ndarray
+            Array to store the result in, or `None`.
+        keep : bool, optional
+            Return the results of all instructions if `True`.
+        m : int, optional
+            Number of interpolation points.
+
+        Returns
+        -------
+        np.ndarray, dict
+            Result of the plan, or the result of every instruction if `keep`.
+        """
+
+        inst, root = self._inst, self._n - 1
+        res, owned = {}, {}
+        grids = {} if meta is None else dict(self._grids)
+
+        free = {key: list(pool) for key, pool in self._pool.items()}
+
+        for i in self._order:
+
+            opp, ia, ib, val = inst[i]
+
+            if opp is None:
+                res[i] = _evaluate(inst[i], res, x, ordered, grids)
+            else:
+
+                if ia is None:
+                    args = (val, res[ib])
+                elif ib is None:
+                    args = (res[ia],) if val is None else (res[ia], val)
+                else:
+                    args = (res[ia], res[ib])
+
+                if not keep:
+                    for j in self._dying[i]:
+                        if j in owned:
+                            free[owned.pop(j)].append(res[j])
+
+                buffer = None
+                if i == root:
+                    buffer = out
+                elif meta is not None and _pooled(opp) and i not in self._escaping:
+                    dtype, shape = meta[i]
+                    key = (dtype, shape + (m,))
+                    if free.get(key):
+                        buffer = free[key].pop()
+                    else:
+                        buffer = np.empty(key[1], dtype=dtype)
+                        self._pool.setdefault(key, []).append(buffer)
+                        free.setdefault(key, [])
+                    owned[i] = key
+
+                if buffer is not None and isinstance(opp, np.ufunc):
+                    res[i] = opp(*args, out=buffer)
+                else:
+                    res[i] = opp(*args)
+
+            if not keep:
+                for j in self._dying[i]:
+                    del res[j]
+
+        if keep:
+            return res
+
+        y = res[root]
+        if out is not None and y is not out:
+            out[...] = y
+            y = out
+
+        return y
+
+
+class BoundPlan(Plan):
+    """BoundPlan(inst, n, x, assume_ordered=False)
+
+    Evaluation plan of a Stroke bound to fixed interpolation points.
+
+    A bound plan does all the work depending only on the interpolation points
+    once: they are validated and sorted, and located on the knots of every
+    leaf. Each call then only gathers the current coefficients of the leaves
+    at the located points and applies the operations of the Stroke.
+
+    Parameters
+    ----------
+    inst : array
+        1D array of instruction arrays.
+    n : int
+        Number of instructions of `inst` belonging to the Stroke.
+    x : array_like
+        1D array of x-coordinates on which to interpolate.
+    assume_ordered : bool, optional
+        Assumes interpolation points are ordered in increasing order if
+        `True`.
+
+    Attributes
+    ----------
+    buffers : int
+        Number of buffers currently held by the pool.
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    Coefficients are read on every call, so a bound plan follows updates of
+    the data of its leaves. Leaves of the SciPy backend are not located and
+    are interpolated on the sorted points on every call.
+
+    Examples
+    --------
+    >>> from polare import Stroke
+    >>> x = np.linspace(-1, 1, 100)
+    >>> s = Stroke(x=x, y=np.exp(x), kind="cubic")
+    >>> plan = (4 * (s + 2) - s / 3).bind(np.linspace(-1, 1, 10 ** 6))
+    >>> ynew = plan()
+    """
+
+    def __init__(self, inst: list, n: int, x: npt.ArrayLike,
+                 assume_ordered: bool=False) -> None:
+
+        super().__init__(inst, n)
+
+        self._x, self._perm = _sort_points(x, assume_ordered)
+        self._ordered = not assume_ordered
+
+        self._grids = {}
+        if self._x.size:
+            for i in self._order:
+                grid = getattr(self._inst[i][3], "_grid", None)
+                if self._inst[i][0] is None and grid is not None and grid not in self._grids:
+                    self._grids[grid] = grid.locate(self._x, self._ordered)
+
+    def __call__(self, out: np.ndarray=None) -> np.ndarray:
+        """Interpolate the function on the bound points.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Array to store the result in.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array of the interpolated values.
+        """
+
+        x, m, ordered = self._x, self._x.size, self._ordered
+
+        if m == 0:
+            return self._run(x, ordered, None, out)
+
+        if self._perm is not None:
+            return _unsort(self._call(x, m, None, ordered), self._perm, out)
+
+        return self._call(x, m, out, ordered)
@@ -1,10 +1,20 @@
 
 
-from polare.interpolant import Interp
+from polare.interpolant import Interp, Stream, _sort_points, _unsort
+from polare.plan import BoundPlan, Plan
+from polare.cache import ResultCache
 from polare._numpy_ufunc_overrides import HANDLED_FUNCTIONS
-from polare._stroke_utils import _extend_inst, _compute
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from polare._stroke_utils import (CHUNK_SIZE, _inst_key, _inst_keys, _find_inst, _extend_inst, _evaluate, _order,
+                                  _shared_grids, _scalar_plan, _channel_shape, _prune, _compute,
+                                  _compute_parallel, _compute_cached, _chunks, _simplify, _serialize,
+                                  _deserialize, _init_worker, _evaluate_worker)
 import numpy as np
 import numpy.typing as npt
+import functools
+import threading
+import operator
+import os
 
 
 class Stroke:
@@ -23,13 +33,40 @@ class Stroke:
         Arrays defining the data point coordinate and function output.
 
         The data in `x` defines the independent variable; the data in `y`
-        define the dependent variable.
+        define the dependent variable. `y` may be 2D of shape
+        ``(channels, len(x))`` to hold several data series on the same `x`.
     kind : {"linear", "quadratic", "cubic"}, optional
         The order of spline interpolation to use. Default is 'linear'.
+    backend : {"polare", "scipy"}, optional
+        Implementation of the interpolant, see `Interp`. Default is 'polare'.
+    uniform : bool, optional
+        Whether `x` is uniformly spaced, see `Interp`. Detected by default.
+    stream : bool, optional
+        Whether data points can be appended to the Stroke, see `Stream`.
+        Requires the "polare" backend. Default is `False`.
+    window : int, optional
+        Number of most recent data points kept by a streaming Stroke. All
+        data points are kept if `None`, the default.
+
+    Attributes
+    ----------
+    counts : np.ndarray
+        Number of times each instruction was evaluated during the most recent
+        call. Every instruction the result depends on is evaluated exactly
+        once.
 
     Methods
     -------
     __call__
+    append
+    bind
+    compile
+    evaluate
+    evaluate_parallel
+    iter_evaluate
+    scalar
+    simplify
+    update
 
     Examples
     --------
@@ -51,22 +88,362 @@ class Stroke:
     >>> ynew = s(xnew)
     >>> plt.plot(x, y, 'ro', xnew, ynew, 'b-')
     >>> plt.show()
+
+    Hold several channels in one Stroke and index them:
+
+    >>> s = Stroke(x=x, y=np.stack([np.sin(x), np.cos(x)]), kind="cubic")
+    >>> s(xnew).shape
+    (2, 1000)
+    >>> evaluate_many([s[0] ** 2, s[1] ** 2], xnew).shape
+    (2, 1000)
     """
 
-    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike, kind: str="linear") -> None:
+    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike, kind: str="linear",
+                 backend: str="polare", uniform: bool=None, stream: bool=False,
+                 window: int=None) -> None:
 
-        self._f = Interp(x, y, kind=kind)
+        if stream:
+            if backend != "polare":
+                raise ValueError("streaming Strokes require the 'polare' backend.")
+            self._f = Stream(x, y, kind=kind, window=window)
+        elif window is not None:
+            raise ValueError("window requires a streaming Stroke.")
+        else:
+            self._f = Interp(x, y, kind=kind, backend=backend, uniform=uniform)
 
         self._inst = [[None, None, None, self._f]]
         self._n = len(self._inst)
+        self._keys = _inst_keys(self._inst, self._n)
 
-    def __call__(self, x: npt.ArrayLike, assume_ordered: bool=False) -> np.ndarray:
+        self._counts = None
+        self._scalar_plan = None
+
+    def __call__(self, x: npt.ArrayLike, assume_ordered: bool=False,
+                 workers: int=None, cache: ResultCache=None) -> np.ndarray:
         """Interpolate the function.
 
+        Parameters
+        ----------
+        x : array_like
+            1D array of x-coordinates on which to interpolate, in any order.
+        assume_ordered : bool, optional
+            Assumes interpolation points are ordered in increasing order if
+            `True`, skipping the order check.
+        workers : int, optional
+            Number of threads evaluating independent instructions, such as
+            separate leaves, concurrently. Instructions are evaluated on the
+            calling thread by default.
+        cache : ResultCache, optional
+            Cache to look instruction results up in and store them to.
+            Cannot be combined with `workers`.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array of the interpolated values.
+
+        Notes
+        -----
+        Unsorted interpolation points are sorted once per call. Every leaf
+        is interpolated on the sorted points and only the final result is
+        permuted back to the order of `x`.
+        """
+
+        counts = [0] * self._n
+
+        if cache is not None:
+            if workers is not None:
+                raise ValueError("cache and workers cannot be combined.")
+            y = _compute_cached(self._inst, self._n - 1, x, assume_ordered, cache, counts)
+        elif workers is None:
+            y = _compute(self._inst, self._n - 1, x, assume_ordered, counts)
+        elif int(workers) != workers or workers < 1:
+            raise ValueError("workers should be a positive integer.")
+        else:
+            y = _compute_parallel(self._inst, self._n - 1, x, assume_ordered, int(workers), counts)
+
+        self._counts = counts
+
+        return y
+
+    def scalar(self, x: float):
+        """Interpolate the function at a single point.
+
+        Parameters
+        ----------
+        x : float
+            x-coordinate on which to interpolate.
+
+        Returns
+        -------
+        y : float
+            Interpolated value, as a NumPy scalar, or array of the values of
+            each channel of a multi-channel Stroke.
+
+        Notes
+        -----
+        Meant for callers evaluating one point at a time, such as root
+        finders and optimisers. Leaves are interpolated on the Python float
+        and operations are applied to scalars, skipping the array validation,
+        sorting and allocation of `__call__`. The evaluation order is computed
+        on the first call and kept. Arithmetic, comparisons and powers run on
+        scalars, while other ufuncs, such as `np.sin`, still cost a ufunc call
+        each.
+
+        Examples
+        --------
+        >>> from scipy.optimize import brentq
+        >>> x = np.linspace(0, 3, 100)
+        >>> s = Stroke(x=x, y=np.cos(x), kind="cubic")
+        >>> root = brentq(s.scalar, 0, 3)
+        """
+
+        plan = self._scalar_plan
+        if plan is None:
+            plan = self._scalar_plan = _scalar_plan(self._inst, self._n - 1)
+
+        x = float(x)
+        out = [None] * self._n
+
+        for i, opp, a, b, val in plan:
+            if opp is None:
+                out[i] = val._scalar(x)
+            elif a is None:
+                out[i] = opp(val, out[b])
+            elif b is None:
+                out[i] = opp(out[a]) if val is None else opp(out[a], val)
+            else:
+                out[i] = opp(out[a], out[b])
+
+        return out[i]
+
+    def append(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        """Append data points to a streaming leaf Stroke.
+
+        Every Stroke built from the leaf evaluates with the appended data
+        points, like after `update`.
+
+        Parameters
+        ----------
+        x : array_like
+            Scalar or 1D array of increasing data point coordinates, all
+            beyond the last data point.
+        y : array_like
+            Function outputs at `x`, with the channel axes of the data first.
+
+        Raises
+        ------
+        ValueError
+            If the Stroke is not a streaming leaf, the shapes of `x` and `y` do
+            not match the data or `x` does not increase beyond the last data
+            point.
+
+        Notes
+        -----
+        Appends take amortised constant time in the number of data points,
+        see `Stream`.
+
+        Examples
+        --------
+        >>> x = np.linspace(0, 1, 100)
+        >>> s = Stroke(x, np.sin(x), kind="cubic", stream=True, window=1000)
+        >>> s.append(1.01, np.sin(1.01))
+        >>> ynew = s(np.linspace(0, 1.01, 1000))
+        """
+
+        if self._n != 1 or not isinstance(self._inst[0][3], Stream):
+            raise ValueError("only a streaming leaf Stroke can be appended to.")
+
+        self._inst[0][3]._append(x, y)
+
+    def update(self, y: npt.ArrayLike) -> None:
+        """Replace the function outputs of a leaf Stroke.
+
+        The interpolant of the Stroke is refitted to `y` in place, so every
+        Stroke built from it, and every plan compiled or bound from those,
+        evaluates with the new data without being rebuilt.
+
+        Parameters
+        ----------
+        y : array_like
+            Array of function outputs of the shape of the current ones, in the
+            order of the `x` the Stroke was constructed with.
+
+        Raises
+        ------
+        ValueError
+            If the Stroke is not a leaf constructed from data points, or `y`
+            differs in shape from the current function outputs.
+
+        Notes
+        -----
+        Results cached in a `ResultCache` for the previous data are dropped
+        the next time the cache is used with the updated Stroke.
+
+        Examples
+        --------
+        >>> x = np.linspace(0, 1, 100)
+        >>> s1, s2 = Stroke(x, np.sin(x)), Stroke(x, np.cos(x))
+        >>> plan = (s1 * s2).bind(np.linspace(0, 1, 1000))
+        >>> s1.update(np.sin(2 * x))
+        >>> ynew = plan()
+        """
+
+        if self._n != 1 or not isinstance(self._inst[0][3], Interp):
+            raise ValueError("only the data of a leaf Stroke can be updated.")
+
+        self._inst[0][3]._update(y)
+
+    def compile(self) -> Plan:
+        """Compile the Stroke into an evaluation plan.
+
+        Returns
+        -------
+        Plan
+            Callable giving the same results as the Stroke while reusing a
+            small pool of buffers for intermediate results.
+        """
+
+        return Plan(self._inst, self._n)
+
+    def bind(self, x: npt.ArrayLike, assume_ordered: bool=False) -> BoundPlan:
+        """Compile the Stroke into an evaluation plan on fixed points.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array of x-coordinates on which to interpolate.
+        assume_ordered : bool, optional
+            Assumes interpolation points are ordered in increasing order if
+            `True`.
+
+        Returns
+        -------
+        BoundPlan
+            Callable without arguments giving the values of the Stroke on `x`.
+            Sorting and locating `x` on the knots of the leaves are done once
+            here rather than on every call.
+        """
+
+        return BoundPlan(self._inst, self._n, x, assume_ordered)
+
+    def iter_evaluate(self, x: npt.ArrayLike, chunk_size: int=CHUNK_SIZE,
+                      assume_ordered: bool=False):
+        """Interpolate the function chunk by chunk.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array of x-coordinates on which to interpolate.
+        chunk_size : int, optional
+            Maximum number of points evaluated at once.
+        assume_ordered : bool, optional
+            Assumes interpolation points are ordered in increasing order if
+            `True`.
+
+        Yields
+        ------
+        y : np.ndarray
+            1D array of the interpolated values of consecutive chunks of `x`.
+
+        Notes
+        -----
+        Each chunk is evaluated through the whole instruction set with a
+        compiled plan, so peak memory is bounded by `chunk_size` rather than
+        the length of `x`. `x` may be a memory-mapped array.
+        """
+
+        plan = self.compile()
+
+        for _, _, xc in _chunks(x, chunk_size):
+            yield plan(xc, assume_ordered)
+
+    def evaluate(self, x: npt.ArrayLike, out: np.ndarray=None, chunk_size: int=CHUNK_SIZE,
+                 assume_ordered: bool=False, workers: int=None) -> np.ndarray:
+        """Interpolate the function chunk by chunk into a single array.
+
+        Parameters
+        ----------
+        x : array_like
+            1D array of x-coordinates on which to interpolate.
+        out : np.ndarray, optional
+            Array to store the result in, such as a memory-mapped array.
+        chunk_size : int, optional
+            Maximum number of points evaluated at once.
+        assume_ordered : bool, optional
+            Assumes interpolation points are ordered in increasing order if
+            `True`.
+        workers : int, optional
+            Number of threads evaluating chunks concurrently. Chunks are
+            evaluated on the calling thread by default.
+
+        Returns
+        -------
+        y : np.ndarray
+            1D array of the interpolated values.
+
+        Notes
+        -----
+        NumPy universal functions and the interpolants release the GIL, so
+        chunks evaluated on separate threads run in parallel. Each thread uses
+        its own compiled plan and writes to a disjoint slice of `out`.
+        """
+
+        if workers is not None and (int(workers) != workers or workers < 1):
+            raise ValueError("workers should be a positive integer.")
+
+        plan = self.compile()
+        chunks = _chunks(x, chunk_size)
+
+        for start, stop, xc in chunks:
+
+            if out is None:
+                y = plan(xc, assume_ordered)
+                out = np.empty(y.shape[:-1] + (np.size(x),), dtype=y.dtype)
+                out[..., start:stop] = y
+            else:
+                plan(xc, assume_ordered, out=out[..., start:stop])
+
+            if workers is not None and workers > 1:
+                break
+
+        else:
+
+            if out is None:
+                out = plan(np.asarray(x).reshape(-1), assume_ordered)
+
+            return out
+
+        local = threading.local()
+
+        def _evaluate_chunk(chunk):
+
+            if not hasattr(local, "plan"):
+                local.plan = self.compile()
+
+            start, stop, xc = chunk
+            local.plan(xc, assume_ordered, out=out[..., start:stop])
+
+        with ThreadPoolExecutor(max_workers=int(workers)) as executor:
+            list(executor.map(_evaluate_chunk, chunks))
+
+        return out
+
+    def evaluate_parallel(self, x: npt.ArrayLike, processes: int=None, out: np.ndarray=None,
+                          chunk_size: int=None, assume_ordered: bool=False) -> np.ndarray:
+        """Interpolate the function chunk by chunk on a process pool.
+
         Parameters
         ----------
         x : array_like
             1D array of x-coordinates on which to interpolate.
+        processes : int, optional
+            Number of worker processes. Defaults to the number of processors.
+        out : np.ndarray, optional
+            Array to store the result in.
+        chunk_size : int, optional
+            Maximum number of points sent to a worker at once. Defaults to
+            splitting `x` evenly between the workers.
         assume_ordered : bool, optional
             Assumes interpolation points are ordered in increasing order if
             `True`.
@@ -75,9 +452,165 @@ class Stroke:
         -------
         y : np.ndarray
             1D array of the interpolated values.
+
+        Notes
+        -----
+        The Stroke is pickled once and shipped to every worker when the pool
+        starts, after which only chunks of `x` and their results are sent
+        between processes.
+        """
+
+        if processes is not None and (int(processes) != processes or processes < 1):
+            raise ValueError("processes should be a positive integer.")
+
+        processes = (os.cpu_count() or 1) if processes is None else int(processes)
+
+        if chunk_size is None:
+            chunk_size = max(1, -(-np.size(x) // processes))
+
+        chunks = list(_chunks(x, chunk_size))
+
+        if not chunks:
+            return self.compile()(np.asarray(x).reshape(-1), assume_ordered)
+
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(self,)) as executor:
+
+            results = executor.map(_evaluate_worker, [xc for _, _, xc in chunks],
+                                   [assume_ordered] * len(chunks))
+
+            for (start, stop, _), y in zip(chunks, results):
+
+                if out is None:
+                    out = np.empty(y.shape[:-1] + (np.size(x),), dtype=y.dtype)
+
+                out[..., start:stop] = y
+
+        return out
+
+    def simplify(self):
+        """Return an algebraically simplified Stroke.
+
+        Returns
+        -------
+        Stroke
+            Stroke evaluating to the same values with fewer instructions.
+
+        Notes
+        -----
+        Chains of scalar operations are folded, identities such as ``s * 1``
+        are dropped, double negations cancel, and ``s - s`` and ``s / s``
+        become constants. Instructions left unused are removed. Folding scalars
+        may change results by rounding. ``s - s`` becomes 0 even where `s` is
+        infinite, and ``s / s`` becomes 1 even where `s` is zero or infinite,
+        although evaluating them there gives `nan`.
+        """
+
+        return self._from_inst(_simplify(self._inst, self._n - 1))
+
+    @classmethod
+    def _from_inst(cls, inst):
+        """Return a Stroke evaluating an instruction array.
+
+        Parameters
+        ----------
+        inst : array
+            1D array of instruction arrays ending with the Stroke's result.
+
+        Returns
+        -------
+        Stroke
+            Stroke owning the instructions of `inst` its result depends on.
+        """
+
+        inst = _prune(inst, len(inst) - 1)
+
+        stroke = cls.__new__(cls)
+        stroke._inst = inst
+        stroke._n = len(inst)
+        stroke._keys = _inst_keys(inst, stroke._n)
+        stroke._f = inst[0][3]
+        stroke._counts = None
+        stroke._scalar_plan = None
+
+        return stroke
+
+    def __getstate__(self) -> dict:
+        """Return the serialisable expression of the Stroke.
+
+        Returns
+        -------
+        dict
+            Expression holding operation names, instruction operands and the
+            data of each distinct leaf.
+        """
+
+        return _serialize(self._inst, self._n)
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild the Stroke from its serialisable expression.
+
+        Parameters
+        ----------
+        state : dict
+            Expression returned by `__getstate__`.
+        """
+
+        self.__dict__.update(self._from_inst(_deserialize(state)).__dict__)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Per-instruction evaluation counts of the most recent call."""
+
+        if self._counts is None:
+            return np.zeros(self._n, dtype=int)
+
+        return np.array(self._counts)
+
+    __iter__ = None
+
+    def __getitem__(self, key):
+        """Return a view of channels of a multi-channel Stroke.
+
+        Parameters
+        ----------
+        key : int, slice, tuple
+            Index into the leading, channel axes of the Stroke's values.
+
+        Returns
+        -------
+        Stroke
+            Stroke evaluating to the selected channels.
+
+        Raises
+        ------
+        IndexError
+            If `key` indexes more axes than the channel axes of the Stroke, or
+            is out of their bounds.
+
+        Notes
+        -----
+        The view shares the Stroke's instructions, so channels of one
+        multi-channel leaf evaluated together, for example with
+        `evaluate_many`, interpolate all channels in a single leaf evaluation.
         """
 
-        return _compute(self._inst, self._n - 1, x, assume_ordered)
+        shape = _channel_shape(self._inst, self._n - 1)
+        index = key if isinstance(key, tuple) else (key,)
+
+        axes = sum(k is not None and k is not Ellipsis for k in index)
+        if axes > len(shape) or sum(k is Ellipsis for k in index) > 1:
+            raise IndexError(f"too many indices for a Stroke with {len(shape)} channel axes.")
+
+        if any(k is Ellipsis for k in index):
+            key = tuple(k2 for k in index
+                        for k2 in ((slice(None),) * (len(shape) - axes) if k is Ellipsis else (k,)))
+
+        np.empty(shape + (0,))[key]
+
+        copy = self._copy()
+        copy._append([operator.getitem, copy._n - 1, None, key])
+
+        return copy
 
     def __pos__(self):
 
@@ -203,15 +736,15 @@ class Stroke:
         copy = self._copy()
 
         if isinstance(other, type(self)):
-            copy._inst = _extend_inst(copy._inst, copy._n, other._inst, other._n)
-            a, b, val = copy._n - 1, copy._n + other._n - 1, None
+            copy._inst, index = _extend_inst(copy._inst, copy._n, other._inst, other._n, copy._keys)
+            a, b, val = copy._n - 1, index[other._n - 1], None
+            copy._n = len(copy._inst)
         else:
             a, b, val = copy._n - 1, None, other
 
         a, b, val = (b, a, val) if r else (a, b, val)
 
-        copy._inst.append([ufunc, a, b, val])
-        copy._n = len(copy._inst)
+        copy._append([ufunc, a, b, val])
 
         return copy
 
@@ -230,8 +763,7 @@ class Stroke:
         """
 
         copy = self._copy()
-        copy._inst.append([ufunc, copy._n - 1, None, None])
-        copy._n += 1
+        copy._append([ufunc, copy._n - 1, None, None])
 
         return copy
 
@@ -251,22 +783,24 @@ class Stroke:
             Post-processd Stroke.
         """
 
-        copy = self._copy()
         i0, i1 = inputs[0], inputs[1]
 
         es, ev, xs, xv = None, None, None, None
 
         if isinstance(i0, (int, float)):
+            copy = i1._copy()
             ev, xs, n = i0, copy._n - 1, copy._n
         elif isinstance(i1, (int, float)):
+            copy = i0._copy()
             es, xv, n = copy._n - 1, i1, copy._n
         else:
-            copy._inst = _extend_inst(i0._inst, i0._n, i1._inst, i1._n)
+            copy = i0._copy()
+            copy._inst, index = _extend_inst(copy._inst, copy._n, i1._inst, i1._n, copy._keys)
             copy._n = len(copy._inst)
-            es, xs, n = i0._n - 1, i0._n + i1._n - 1, i0._n + i1._n
+            es, xs, n = i0._n - 1, index[i1._n - 1], copy._n
 
         new_inst = func(es, ev, xs, xv, n)
-        copy._inst = _extend_inst(copy._inst, copy._n, new_inst, len(new_inst))
+        copy._inst, _ = _extend_inst(copy._inst, copy._n, new_inst, len(new_inst), copy._keys)
         copy._n = len(copy._inst)
 
         return copy
@@ -278,17 +812,53 @@ class Stroke:
         -------
         Stroke
             Stroke with different place in memory as original.
+
+        Notes
+        -----
+        Instructions are never modified once appended, and a Stroke only reads
+        the first `_n` entries of `_inst`. The copy therefore shares the
+        instruction array, key table and interpolants of the original. The
+        array is only duplicated when another Stroke has already appended past
+        `_n`, so that appending to the copy cannot clobber those instructions.
+        The key table stays shared, see `_find_inst`.
         """
 
-        x, y = self._f._f.x.copy(), self._f._f.y.copy()
-        kind = self._f._kind
+        stroke_copy = Stroke.__new__(Stroke)
+        stroke_copy._f = self._f
+        stroke_copy._keys = self._keys
+
+        if len(self._inst) == self._n:
+            stroke_copy._inst = self._inst
+        else:
+            stroke_copy._inst = self._inst[:self._n]
 
-        stroke_copy = Stroke(x, y, kind)
-        stroke_copy._inst = self._inst.copy()
         stroke_copy._n = self._n
+        stroke_copy._counts = None
+        stroke_copy._scalar_plan = None
 
         return stroke_copy
 
+    def _append(self, inst):
+        """Append an instruction to a Stroke.
+
+        Parameters
+        ----------
+        inst : array
+            Instruction array whose operands index existing instructions.
+
+        Notes
+        -----
+        The Stroke must own the tail of its instruction array, as is the case
+        for Strokes returned by `_copy`.
+        """
+
+        key = _inst_key(inst)
+        if key is not None and _find_inst(self._keys, key, self._inst) is None:
+            self._keys.setdefault(key, []).append(self._n)
+
+        self._inst.append(inst)
+        self._n += 1
+
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         """Handle NumPy universal functions.
 
@@ -312,28 +882,104 @@ class Stroke:
             try:
 
                 i0, i1 = inputs[0], inputs[1]
-                copy = self._copy()
 
                 if isinstance(i0, (int, float)):
+                    copy = i1._copy()
                     a, b, val = None, i1._n - 1, i0
                 elif isinstance(i1, (int, float)):
+                    copy = i0._copy()
                     a, b, val = i0._n - 1, None, i1
                 else:
-                    copy._inst = _extend_inst(i0._inst, i0._n, i1._inst, i1._n)
-                    a, b, val = i0._n - 1, i0._n + i1._n - 1, None
+                    copy = i0._copy()
+                    copy._inst, index = _extend_inst(copy._inst, copy._n, i1._inst, i1._n, copy._keys)
+                    copy._n = len(copy._inst)
+                    a, b, val = i0._n - 1, index[i1._n - 1], None
 
             except:
 
                 i0 = inputs[0]
-                copy = self._copy()
+                copy = i0._copy()
 
                 a, b, val = i0._n - 1, None, None
 
-            copy._inst.append([ufunc, a, b, val])
-            copy._n = len(copy._inst)
+            copy._append([ufunc, a, b, val])
 
             return copy
 
         else:
 
             return NotImplemented
+
+
+def evaluate_many(strokes: npt.ArrayLike, x: npt.ArrayLike, assume_ordered: bool=False) -> np.ndarray:
+    """Interpolate several Strokes at once.
+
+    Parameters
+    ----------
+    strokes : array_like
+        Array of Strokes, such as the result of ``np.matmul(c3, v1)``. Scalar
+        entries are broadcast to the interpolation points.
+    x : array_like
+        1D array of x-coordinates on which to interpolate.
+    assume_ordered : bool, optional
+        Assumes interpolation points are ordered in increasing order if
+        `True`.
+
+    Returns
+    -------
+    y : np.ndarray
+        Array of shape ``strokes.shape + (len(x),)`` holding the interpolated
+        values of each Stroke, with the channel axes of multi-channel Strokes
+        before the last axis.
+
+    Notes
+    -----
+    The instructions of all Strokes are merged into a single instruction array,
+    sharing identical leaves and sub-expressions, so every distinct
+    instruction is evaluated once for all Strokes.
+
+    Examples
+    --------
+    >>> from polare import Stroke, evaluate_many
+    >>> t = np.linspace(0, 10, 100)
+    >>> v1 = np.array([Stroke(t, np.cos(t)), Stroke(t, np.sin(t)), 1])
+    >>> evaluate_many(v1, np.linspace(0, 9, 10)).shape
+    (3, 10)
+    """
+
+    strokes = np.asarray(strokes, dtype=object)
+
+    inst, keys, roots = [], {}, []
+
+    for stroke in strokes.reshape(-1):
+        if isinstance(stroke, Stroke):
+            inst, index = _extend_inst(inst, len(inst), stroke._inst, stroke._n, keys)
+            roots.append(index[stroke._n - 1])
+        else:
+            roots.append(None)
+
+    x, perm = _sort_points(x, assume_ordered)
+    ordered = not assume_ordered
+
+    order = _order(inst, [i for i in roots if i is not None])
+
+    out, grids = [None] * len(inst), _shared_grids(inst, order)
+    for i in order:
+        out[i] = _evaluate(inst[i], out, x, ordered, grids)
+
+    values = [stroke if i is None else out[i] for stroke, i in zip(strokes.reshape(-1), roots)]
+
+    m = np.size(x)
+    for i in roots:
+        if i is not None:
+            m = np.shape(out[i])[-1]
+            break
+
+    shape = np.broadcast_shapes((m,), *(np.shape(value) for value in values))
+    dtype = functools.reduce(np.result_type, values, np.dtype(bool)) if values else float
+
+    y = np.empty((len(values),) + shape, dtype=dtype)
+    for row, value in zip(y, values):
+        row[...] = value
+
+    return _unsort(y, perm).reshape(strokes.shape + shape)
@@ -1,9 +1,10 @@
 
 
-from polare.interpolant import Interp
+from polare.interpolant import Interp, Stream, _UniformGrid
 from unittest import TestCase
 import numpy as np
 import unittest
+import pickle
 
 
 class TestPolyInterp(TestCase):
@@ -31,6 +32,125 @@ class TestPolyInterp(TestCase):
         ytest = Interp(self.x, self.y, "cubic")(self.xnew)
         self.assertTrue(np.allclose(self.ynew, ytest, rtol=0.01))
 
+    def test_backend(self):
+
+        for kind in ["linear", "quadratic", "cubic"]:
+
+            f = Interp(self.x, self.y, kind)
+            g = Interp(self.x, self.y, kind, backend="scipy")
+
+            self.assertIsNone(f._f)
+            self.assertTrue(np.allclose(f(self.xnew), g(self.xnew), rtol=1e-12))
+            self.assertTrue(np.allclose(f(self.x), self.y, rtol=1e-12))
+
+        f = Interp(self.x[::-1], self.y[::-1], "cubic")
+        self.assertTrue(np.allclose(f(self.xnew), g(self.xnew), rtol=1e-12))
+
+        self.assertRaises(ValueError, f, self.xnew + 1)
+        self.assertRaises(ValueError, Interp, self.x, self.y, "nearest")
+        self.assertRaises(ValueError, Interp, self.x, self.y, "linear", backend="numba")
+        self.assertRaises(ValueError, Interp, self.x, self.y[:-1], "linear")
+
+    def test_uniform(self):
+
+        for kind in ["linear", "quadratic", "cubic"]:
+
+            f = Interp(self.x, self.y, kind)
+            g = Interp(self.x, self.y, kind, uniform=False)
+
+            self.assertEqual(f._x is None, kind != "linear")
+            self.assertEqual(f._span, (0, 10, 100))
+            self.assertIsInstance(f._grid, _UniformGrid)
+            self.assertTrue(np.allclose(f(self.xnew), g(self.xnew), rtol=1e-12))
+            self.assertTrue(np.allclose(pickle.loads(pickle.dumps(f))(self.xnew), f(self.xnew), rtol=1e-12))
+
+        x = np.cumsum(np.full(100, 0.1))
+        self.assertIsNotNone(Interp(x, self.y, "cubic")._x)
+        self.assertIsNone(Interp(x, self.y, "cubic", uniform=True)._x)
+        self.assertIsNone(Interp(self.x, np.stack([self.y, self.y]), "linear")._x)
+
+        self.assertRaises(ValueError, Interp, self.x ** 2, self.y, "linear", uniform=True)
+
+    def test_linear_kernel(self):
+
+        f = Interp(self.x ** 2, self.y, "linear")
+        g = Interp(self.x ** 2, self.y, "linear", backend="scipy")
+
+        self.assertTrue(f._linear)
+        self.assertTrue(np.array_equal(f(self.xnew ** 2), g(self.xnew ** 2)))
+        self.assertTrue(np.allclose(f(self.xnew ** 2), f._at(*f._grid.locate(self.xnew ** 2)), rtol=1e-12))
+        self.assertTrue(np.array_equal(f(50.0), g([50.0])))
+        self.assertRaises(ValueError, f, [-1.0])
+        self.assertRaises(ValueError, f, [101.0])
+
+    def test_points(self):
+
+        f = Interp(self.x, self.y, "cubic")
+
+        self.assertEqual(f(5.0).shape, (1,))
+        self.assertRaises(ValueError, f, self.xnew.reshape(2, -1))
+        self.assertRaises(UserWarning, f, self.xnew[::-1])
+        self.assertTrue(np.allclose(f(self.xnew[::-1], assume_ordered=True), f(self.xnew)[::-1]))
+
+        xnew = self.xnew.copy()
+        f(xnew)
+        self.assertTrue(xnew.flags.writeable)
+        self.assertTrue(np.array_equal(xnew, self.xnew))
+
+        x = np.sort(np.random.default_rng(0).uniform(0, 10, 100))
+        x[[0, -1]] = 0, 10
+
+        for xi in [self.x, x]:
+            for kind in ["linear", "quadratic", "cubic"]:
+                for f in [Interp(xi, np.sin(xi), kind), Interp(xi, np.sin(xi), kind, backend="scipy"),
+                          Interp(xi, np.stack([xi, xi]), kind), Stream(xi, np.sin(xi), kind)]:
+                    self.assertRaises(ValueError, f, [0.5, 12.0, 0.7], assume_ordered=True)
+                    self.assertRaises(ValueError, f, [0.5, -2.0, 0.7], assume_ordered=True)
+
+    def test_stream(self):
+
+        x = np.cumsum(np.random.default_rng(0).uniform(0.05, 0.15, 200))
+        y = np.stack([np.sin(x), x ** 2])
+
+        for kind in ["linear", "quadratic", "cubic"]:
+            for window in [None, 3, 50]:
+
+                f = Stream(x[:2], y[:, :2], kind, window)
+
+                i = 2
+                for k in [1, 3, 1, 60, 7, 2, 124]:
+
+                    f._append(x[i:i + k], y[:, i:i + k])
+                    i += k
+
+                    lo = 0 if window is None else max(0, i - window)
+                    ref = Stream(x[lo:i], y[:, lo:i], kind)
+
+                    self.assertTrue(np.array_equal(f._x, x[lo:i]))
+                    self.assertTrue(np.allclose(f._c, ref._c))
+
+                xnew = np.linspace(f._x[0], f._x[-1], 100)
+                ytest = f(xnew)
+
+                self.assertTrue(np.allclose(ytest[0], np.sin(xnew), atol=0.01))
+                if kind != "linear":
+                    self.assertTrue(np.allclose(ytest[1], xnew ** 2))
+
+                self.assertTrue(np.allclose(f._scalar(xnew[37]), ytest[:, 37]))
+                self.assertTrue(np.allclose(pickle.loads(pickle.dumps(f))(xnew), ytest))
+
+        f = Stream(x[:10], np.sin(x[:10]), "cubic")
+        for xi in x[10:]:
+            f._append(xi, np.sin(xi))
+
+        self.assertLess(len(f._xb), 2 * len(x))
+        self.assertTrue(np.allclose(f(self.xnew[:200] / 10 + x[0]), np.sin(self.xnew[:200] / 10 + x[0]), atol=1e-4))
+        self.assertRaises(ValueError, f._append, x[-1], 0)
+        self.assertRaises(ValueError, f._append, [x[-1] + 2, x[-1] + 1], [0, 0])
+        self.assertRaises(ValueError, f._append, x[-1] + 1, [0, 0])
+        self.assertRaises(ValueError, Stream, [0, 1, 1], [0, 1, 2])
+        self.assertRaises(ValueError, Stream, x, x, window=1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,655 @@
+from polare import ResultCache, Stroke, evaluate_many
+from polare._stroke_utils import _extend_inst, _order
+from polare.interpolant import _Grid, _UniformGrid, _check_range
+from scipy.special import erf
+from unittest import TestCase, mock
+import numpy as np
+import unittest
+import tempfile
+import pickle
+import sys
+import os
+
+
+class TestStrokeEvaluation(TestCase):
+
+    def setUp(self):
+
+        self.x = np.linspace(-1, 1, 10)
+        self.y = np.exp(self.x) + np.cos(np.pi * self.x) - 1
+
+        self.f1 = Stroke(self.x, self.y, "linear")
+        self.f3 = Stroke(self.x, self.y, "cubic")
+
+        self.xnew = np.linspace(-1, 1, 100)
+
+    def test_deep_expression(self):
+
+        depth = sys.getrecursionlimit() + 100
+
+        s = self.f1
+        for _ in range(depth):
+            s = s + 1
+
+        self.assertTrue(np.allclose(s(self.xnew), self.f1(self.xnew) + depth))
+
+    def test_shared_instructions_evaluated_once(self):
+
+        s = ((self.f3 ** 2) ** 2) ** 2
+        y = s(self.xnew)
+
+        self.assertTrue(np.allclose(y, self.f3(self.xnew) ** 8))
+        self.assertTrue(np.all(s.counts <= 1))
+        self.assertEqual(s.counts[0], 1)
+        self.assertEqual(s.counts[-1], 1)
+
+    def test_counts(self):
+
+        s = self.f1 * self.f3
+
+        self.assertTrue(np.array_equal(s.counts, np.zeros(3)))
+
+        s(self.xnew)
+        self.assertTrue(np.array_equal(s.counts, np.ones(3)))
+
+    def test_shared_leaves(self):
+
+        s = (self.f1 * self.f1 + self.f1 * self.f3) / (self.f1 * self.f1)
+        y = s(self.xnew)
+
+        y1, y3 = self.f1(self.xnew), self.f3(self.xnew)
+        self.assertTrue(np.allclose(y, (y1 * y1 + y1 * y3) / (y1 * y1)))
+
+        leaves = [i for i in s._inst[:s._n] if i[0] is None]
+        self.assertEqual(len(leaves), 2)
+        self.assertEqual(s._n, 6)
+        self.assertTrue(np.all(s.counts == 1))
+
+        v1 = np.array([self.f1, self.f3])
+        s = np.dot(v1, v1) / np.linalg.norm(v1)
+
+        leaves = [i for i in s._inst[:s._n] if i[0] is None]
+        self.assertEqual(len(leaves), 2)
+
+    def test_structural_sharing(self):
+
+        a = self.f1 + 1
+        b = self.f1 * 2
+        c = a - 1
+        d = a * 3
+
+        self.assertIs(a._inst, c._inst)
+        self.assertIs(a._inst[0][3], self.f1._f)
+        self.assertIs(d._inst[0][3], self.f1._f)
+
+        y = self.f1(self.xnew)
+        self.assertTrue(np.allclose(a(self.xnew), y + 1))
+        self.assertTrue(np.allclose(b(self.xnew), y * 2))
+        self.assertTrue(np.allclose(c(self.xnew), y))
+        self.assertTrue(np.allclose(d(self.xnew), (y + 1) * 3))
+        self.assertTrue(np.allclose(self.f1(self.xnew), y))
+
+        e = np.copysign(self.f1, 0.0) - np.copysign(self.f1, -0.0)
+        self.assertTrue(np.allclose(e(self.xnew), 2 * np.abs(y)))
+        self.assertTrue(np.allclose(e.simplify()(self.xnew), 2 * np.abs(y)))
+        self.assertTrue(np.allclose(e(self.xnew, cache=ResultCache()), 2 * np.abs(y)))
+
+    def test_branching_construction(self):
+
+        e = self.f1
+        for i in range(2000):
+            f = e * 2
+            e = e + 1
+
+        self.assertEqual((e._n, f._n), (2001, 2001))
+        self.assertIs(e._keys, self.f1._keys)
+        self.assertTrue(np.allclose(e(self.xnew), self.f1(self.xnew) + 2000))
+        self.assertTrue(np.allclose(f(self.xnew), 2 * (self.f1(self.xnew) + 1999)))
+
+        c, s = np.cos(self.f3), np.sin(self.f3)
+        r = c * c + s * s + c * s
+
+        self.assertEqual(r._n, 8)
+        self.assertTrue(np.allclose(r(self.xnew), 1 + c(self.xnew) * s(self.xnew)))
+
+    def test_compile(self):
+
+        s = self.f3
+        for _ in range(20):
+            s = np.sin(s * 1.1 + self.f1)
+        s = (s > 0) * s - self.f1 ** 2
+
+        plan = s.compile()
+        y = s(self.xnew)
+
+        self.assertTrue(np.array_equal(plan(self.xnew), y))
+        self.assertTrue(np.array_equal(plan(self.xnew), y))
+        self.assertLessEqual(plan.buffers, 4)
+
+        out = np.empty_like(y)
+        self.assertIs(plan(self.xnew, out=out), out)
+        self.assertTrue(np.array_equal(out, y))
+
+        self.assertTrue(np.array_equal(plan(self.xnew[:10]), s(self.xnew[:10])))
+        self.assertTrue(np.array_equal(self.f1.compile()(self.xnew), self.f1(self.xnew)))
+
+    def test_bind(self):
+
+        ys = np.stack([self.y, np.sin(self.x)])
+        g = Stroke(self.x, ys, "quadratic")
+        h = Stroke(np.linspace(-1, 1, 7), np.arange(7.0), "cubic", backend="scipy")
+
+        s = np.sin(self.f1 * self.f3) + g[1] / (self.f3 + 3) - h ** 2
+        xnew = np.random.default_rng(0).uniform(-1, 1, 50)
+
+        plan = s.bind(xnew)
+        y = s(xnew)
+
+        self.assertTrue(np.allclose(plan(), y))
+        self.assertTrue(np.allclose(plan(), y))
+
+        out = np.empty(50)
+        self.assertIs(plan(out=out), out)
+        self.assertTrue(np.allclose(out, y))
+
+        with mock.patch.object(_Grid, "locate") as locate:
+            plan()
+            locate.assert_not_called()
+
+        self.assertTrue(np.allclose(g.bind(self.xnew, assume_ordered=True)(), g(self.xnew)))
+        self.assertEqual(s.bind([])().shape, (0,))
+        self.assertRaises(ValueError, s.bind, [0, 2])
+
+    def test_update(self):
+
+        xnew = np.random.default_rng(0).uniform(-1, 1, 50)
+        x = self.x[::-1]
+        ys = np.stack([self.y, np.sin(self.x)])
+
+        for backend in ["polare", "scipy"]:
+            for kind in ["linear", "cubic"]:
+
+                f = Stroke(x, self.y[::-1], kind, backend=backend)
+                g = Stroke(self.x, ys, kind, backend=backend)
+                s = f * g[1] + 2
+
+                cache = ResultCache()
+                plan, bound = s.compile(), s.bind(xnew)
+                for evaluate in [lambda: s(xnew, cache=cache), lambda: plan(xnew), bound]:
+                    evaluate()
+
+                f.update(np.cos(x))
+                g.update(2 * ys)
+
+                y = Stroke(self.x, np.cos(self.x), kind, backend=backend)(xnew) * \
+                    Stroke(self.x, 2 * np.sin(self.x), kind, backend=backend)(xnew) + 2
+
+                for evaluate in [lambda: s(xnew), lambda: s(xnew, cache=cache), lambda: plan(xnew),
+                                 bound, lambda: np.array([s.scalar(p) for p in xnew])]:
+                    self.assertTrue(np.allclose(evaluate(), y))
+
+                self.assertTrue(np.allclose(pickle.loads(pickle.dumps(f))(xnew), f(xnew)))
+
+        f = Stroke(self.x, self.y)
+        f.update(np.arange(10))
+
+        self.assertTrue(np.allclose(f(self.xnew), 4.5 * (self.xnew + 1)))
+        self.assertRaises(ValueError, f.update, np.ones(9))
+        self.assertRaises(ValueError, (f + 1).update, self.y)
+
+    def test_stream(self):
+
+        x = np.linspace(0, 10, 101)
+        f = Stroke(x[:60], np.sin(x[:60]), "cubic", stream=True, window=60)
+        g = Stroke(x, np.cos(x), "cubic")
+        s = f * g + 1
+
+        cache = ResultCache()
+        xnew = np.linspace(5, 8, 40)
+        plan, bound = s.compile(), s.bind(xnew[:10])
+        s(xnew[:10], cache=cache)
+
+        for i in range(60, 101, 10):
+            f.append(x[i:i + 10], np.sin(x[i:i + 10]))
+
+        y = np.sin(xnew) * np.cos(xnew) + 1
+
+        for evaluate in [lambda: s(xnew), lambda: plan(xnew), lambda: np.array([s.scalar(p) for p in xnew])]:
+            self.assertTrue(np.allclose(evaluate(), y, atol=1e-3))
+
+        self.assertTrue(np.allclose(s(xnew[:10], cache=cache), y[:10], atol=1e-3))
+        self.assertTrue(np.allclose(bound(), y[:10], atol=1e-3))
+        self.assertTrue(np.allclose(pickle.loads(pickle.dumps(s))(xnew), s(xnew)))
+        self.assertEqual(f._f._x[0], x[41])
+
+        f.update(np.zeros(60))
+        self.assertTrue(np.allclose(s(xnew), 1))
+
+        self.assertRaises(ValueError, s.append, 11, 0)
+        self.assertRaises(ValueError, g.append, 11, 0)
+        self.assertRaises(ValueError, Stroke, x, x, stream=True, backend="scipy")
+        self.assertRaises(ValueError, Stroke, x, x, window=10)
+
+    def test_chunked_evaluation(self):
+
+        s = np.cos(3 * self.f3) + self.f1
+        y = s(self.xnew)
+
+        chunks = list(s.iter_evaluate(self.xnew, chunk_size=30))
+        self.assertEqual([len(c) for c in chunks], [30, 30, 30, 10])
+        self.assertTrue(np.array_equal(np.concatenate(chunks), y))
+
+        self.assertTrue(np.array_equal(s.evaluate(self.xnew, chunk_size=7), y))
+        self.assertRaises(ValueError, s.evaluate, self.xnew, chunk_size=0)
+        self.assertTrue(np.array_equal(s.evaluate(self.xnew[::-1], chunk_size=7), y[::-1]))
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            xmap = np.memmap(os.path.join(tmp, "x.dat"), dtype=float, mode="w+", shape=self.xnew.shape)
+            ymap = np.memmap(os.path.join(tmp, "y.dat"), dtype=float, mode="w+", shape=self.xnew.shape)
+            xmap[:] = self.xnew
+
+            self.assertIs(s.evaluate(xmap, out=ymap, chunk_size=16), ymap)
+            self.assertTrue(np.array_equal(ymap, y))
+
+            del xmap, ymap
+
+    def test_threaded_evaluation(self):
+
+        s = np.cos(3 * self.f3) + self.f1
+        y = s(self.xnew)
+
+        self.assertTrue(np.array_equal(s.evaluate(self.xnew, chunk_size=7, workers=3), y))
+        self.assertTrue(np.array_equal(s.evaluate(self.xnew, workers=3), y))
+
+        out = np.empty_like(y)
+        self.assertIs(s.evaluate(self.xnew, out=out, chunk_size=9, workers=2), out)
+        self.assertTrue(np.array_equal(out, y))
+
+        self.assertRaises(ValueError, s.evaluate, self.xnew, workers=0)
+
+    def test_graph_parallel_evaluation(self):
+
+        theta = np.arctan(self.f3)
+        c3 = np.array([[np.cos(theta), -np.sin(theta), 0],
+                       [np.sin(theta), np.cos(theta), 0],
+                       [0, 0, 1]])
+        v1 = np.array([self.f1, self.f3, self.f1 * self.f3])
+
+        for s in np.matmul(c3, v1):
+
+            y = s(self.xnew)
+
+            self.assertTrue(np.array_equal(s(self.xnew, workers=4), y))
+            self.assertTrue(np.all(s.counts == 1))
+
+        self.assertRaises(ValueError, self.f1, self.xnew, workers=0)
+
+    def test_pickle(self):
+
+        s = np.cos(3 * self.f3) + self.f1 ** 2 / self.f3
+        state = s.__getstate__()
+
+        self.assertEqual(len(state["leaves"]), 2)
+        self.assertTrue(all(isinstance(i[0], (str, type(None))) for i in state["inst"]))
+
+        t = pickle.loads(pickle.dumps(s))
+        self.assertTrue(np.array_equal(t(self.xnew), s(self.xnew)))
+        self.assertTrue(np.array_equal((t + 1)(self.xnew), s(self.xnew) + 1))
+
+        s = erf(self.f3) + 1
+        self.assertTrue(np.array_equal(pickle.loads(pickle.dumps(s))(self.xnew), s(self.xnew)))
+        self.assertTrue(np.array_equal(s.evaluate_parallel(self.xnew, processes=2), s(self.xnew)))
+
+    def test_process_parallel_evaluation(self):
+
+        s = np.cos(3 * self.f3) + self.f1
+        y = s(self.xnew)
+
+        self.assertTrue(np.array_equal(s.evaluate_parallel(self.xnew, processes=2), y))
+        self.assertTrue(np.array_equal(s.evaluate_parallel(self.xnew, processes=2, chunk_size=7), y))
+        self.assertRaises(ValueError, s.evaluate_parallel, self.xnew, processes=0)
+
+    def test_evaluate_many(self):
+
+        theta = np.arctan(self.f3)
+        c3 = np.array([[np.cos(theta), -np.sin(theta), 0],
+                       [np.sin(theta), np.cos(theta), 0],
+                       [0, 0, 1]])
+        v1 = np.array([self.f1, self.f3, 1])
+        new_pos = np.matmul(c3, v1)
+
+        y = evaluate_many(new_pos, self.xnew)
+
+        self.assertEqual(y.shape, (3, 100))
+        for i in range(2):
+            self.assertTrue(np.allclose(y[i], new_pos[i](self.xnew)))
+        self.assertTrue(np.all(y[2] == 1))
+
+        y = evaluate_many(c3, self.xnew)
+
+        self.assertEqual(y.shape, (3, 3, 100))
+        self.assertTrue(np.allclose(y[1, 0], np.sin(theta)(self.xnew)))
+        self.assertTrue(np.all(y[2, 2] == 1))
+
+    def test_result_cache(self):
+
+        cache = ResultCache()
+
+        s = np.cos(3 * self.f3) + self.f1
+        y = s(self.xnew, cache=cache)
+
+        self.assertTrue(np.array_equal(y, s(self.xnew)))
+        self.assertEqual((cache.hits, cache.misses), (0, 5))
+
+        y[:] = 0
+        self.assertTrue(np.array_equal(s(self.xnew, cache=cache), s(self.xnew)))
+        self.assertEqual((cache.hits, cache.misses), (1, 5))
+
+        t = np.cos(3 * self.f3) * 2
+        yt = t(self.xnew, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 6))
+        self.assertTrue(np.all(t.counts[:-1] == 0))
+        self.assertTrue(np.array_equal(yt, t(self.xnew)))
+
+        s(self.xnew[:50], cache=cache)
+        self.assertEqual(cache.misses, 11)
+
+        self.assertRaises(ValueError, s, self.xnew, workers=2, cache=cache)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes, cache.hits), (0, 0, 0))
+
+    def test_result_cache_eviction(self):
+
+        cache = ResultCache(max_bytes=3 * self.xnew.nbytes)
+
+        s = ((self.f1 + 1) * 2 - 3) / 4
+        s(self.xnew, cache=cache)
+
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.nbytes, 3 * self.xnew.nbytes)
+
+        s(self.xnew, cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+        cache = ResultCache()
+        f = Stroke(self.x, self.y, stream=True)
+        s = np.cos(3 * self.f3) + f * 2
+
+        for i in range(20):
+            s(self.xnew, cache=cache)
+            f.append(1 + (i + 1) / 10, 0)
+
+        self.assertTrue(np.allclose(s(self.xnew, cache=cache), s(self.xnew)))
+        self.assertEqual(len(cache), 6)
+        self.assertEqual(len(cache._ids), 6)
+        self.assertEqual(cache.nbytes, 6 * self.xnew.nbytes)
+
+        cache = ResultCache(max_bytes=10 * self.xnew.nbytes)
+        for i in range(200):
+            f = Stroke(self.x, self.y + i)
+            (np.cos(3 * f) + f * 2 + 1)(self.xnew, cache=cache)
+
+        self.assertEqual(len(cache), 6)
+        for table in (cache._ids, cache._keys, cache._dependents, cache._fingerprints):
+            self.assertEqual(len(table), 6)
+        self.assertEqual(len(cache._leaves), 1)
+
+    def test_simplify(self):
+
+        y1, y3 = self.f1(self.xnew), self.f3(self.xnew)
+
+        s = ((self.f1 + 1) + 2) * 3 * 4
+        t = s.simplify()
+        self.assertEqual(t._n, 3)
+        self.assertTrue(np.allclose(t(self.xnew), (y1 + 3) * 12))
+
+        for s in [-(-self.f1), self.f1 * 1, self.f1 / 1, +self.f1, self.f1 - 0]:
+            t = s.simplify()
+            self.assertEqual(t._n, 1)
+            self.assertTrue(np.array_equal(t(self.xnew), y1))
+
+        s = (self.f1 - self.f1) + self.f3 * (self.f3 / self.f3)
+        t = s.simplify()
+        self.assertEqual(t._n, 1)
+        self.assertTrue(np.allclose(t(self.xnew), y3))
+
+        s = np.sqrt(self.f1 / self.f1 + 3)
+        t = s.simplify()
+        self.assertEqual(t._n, 1)
+        self.assertTrue(np.allclose(t(self.xnew), 2))
+
+        s = (self.f3 > 0) + 0
+        t = s.simplify()
+        self.assertEqual(t._n, s._n)
+        self.assertTrue(np.array_equal(t(self.xnew), s(self.xnew)))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for s in [np.true_divide(self.f3 * 2, 0), np.true_divide(self.f3, 0) * 3,
+                      np.true_divide(np.multiply(self.f3, 0), 0)]:
+                self.assertTrue(np.array_equal(s.simplify()(self.xnew), s(self.xnew), equal_nan=True))
+
+        g = Stroke(self.x, np.stack([self.y, self.y]))
+        for s in [g - g, g / g + 1, (g - g) + self.f1]:
+            self.assertEqual(s.simplify()(self.xnew).shape, (2, 100))
+            self.assertTrue(np.allclose(s.simplify()(self.xnew), s(self.xnew)))
+
+    def test_unsorted_points(self):
+
+        s = np.cos(3 * self.f3) + self.f1 * self.f3
+        y = s(self.xnew)
+
+        order = np.random.default_rng(0).permutation(self.xnew.size)
+        xnew = self.xnew[order]
+
+        self.assertTrue(np.array_equal(s(xnew), y[order]))
+        self.assertTrue(np.array_equal(s(xnew, workers=2), y[order]))
+        self.assertTrue(np.array_equal(s(xnew, cache=ResultCache()), y[order]))
+        self.assertTrue(np.array_equal(s.compile()(xnew), y[order]))
+        self.assertTrue(np.array_equal(evaluate_many([s, 1], xnew)[0], y[order]))
+        self.assertTrue(np.all(s.counts == 1))
+
+        out = np.empty_like(y)
+        self.assertIs(s.compile()(xnew, out=out), out)
+        self.assertTrue(np.array_equal(out, y[order]))
+
+        xbad = np.array([0.5, 2.0, 0.7])
+        for evaluate in [lambda: s(xbad, assume_ordered=True), lambda: s.compile()(xbad, assume_ordered=True),
+                         lambda: s.bind(xbad, assume_ordered=True)()]:
+            self.assertRaises(ValueError, evaluate)
+
+        g = s + Stroke(self.x ** 3, self.y, "linear")
+        with mock.patch("polare.interpolant._check_range", side_effect=_check_range) as check:
+            for evaluate in [lambda: g(xnew), lambda: g(xnew, workers=2), lambda: g(xnew, cache=ResultCache()),
+                             lambda: g.compile()(xnew), lambda: g.bind(xnew)(), lambda: evaluate_many([g], xnew)]:
+                evaluate()
+
+        self.assertTrue(check.call_count)
+        self.assertTrue(all(call.args[3] for call in check.call_args_list))
+
+    def test_shared_grid(self):
+
+        f2 = Stroke(self.x, self.y, "quadratic")
+        g1 = Stroke(self.x, 2 * self.y, "linear")
+        g3 = Stroke(self.x, np.sin(self.x), "cubic")
+
+        self.assertIs(self.f1._f._grid, g1._f._grid)
+        self.assertIs(self.f3._f._grid, g3._f._grid)
+        self.assertIs(self.f1._f._grid, self.f3._f._grid)
+        self.assertIsNot(self.f1._f._grid, f2._f._grid)
+
+        s = self.f1 * g1 + self.f3 * g3 - f2
+
+        with mock.patch.object(_UniformGrid, "locate", autospec=True, side_effect=_UniformGrid.locate) as locate:
+            y = s(self.xnew)
+
+        self.assertEqual(locate.call_count, 2)
+
+        y1, y3 = self.f1._f(self.xnew), self.f3._f(self.xnew)
+        self.assertTrue(np.allclose(y, y1 * 2 * y1 + y3 * g3._f(self.xnew) - f2._f(self.xnew)))
+
+        self.assertRaises(ValueError, s, self.xnew + 1)
+
+        x = self.x ** 3
+        h1, h2 = Stroke(x, self.y, "linear"), Stroke(x, np.sin(x), "linear")
+        h3 = Stroke(x, np.sin(x), "cubic")
+
+        self.assertIsInstance(h1._f._grid, _Grid)
+        self.assertIs(h1._f._grid, h2._f._grid)
+        self.assertIsNot(h1._f._grid, h3._f._grid)
+
+        with mock.patch.object(_Grid, "locate", autospec=True, side_effect=_Grid.locate) as locate:
+            y = (h1 * h3 + h2 - h3 * 2)(self.xnew)
+
+        self.assertEqual(locate.call_count, 2)
+        self.assertTrue(np.allclose(y, h1(self.xnew) * h3(self.xnew) + h2(self.xnew) - h3(self.xnew) * 2))
+
+    def test_duplicate_knots(self):
+
+        xnew = np.array([0, 0.5, 1, 1.5, 2])
+
+        for x in [[0, 1, 1, 2], [0, 0, 1, 2], [0, 1, 2, 2]]:
+
+            a, b = Stroke(x, [0, 1, 2, 3]), Stroke(x, [0, 10, 20, 30])
+            y = np.interp(xnew, x, [0, 11, 22, 33])
+
+            self.assertTrue(np.array_equal((a + b)(xnew), y))
+            self.assertTrue(np.array_equal((a + b).bind(xnew)(), y))
+            self.assertTrue(np.array_equal([(a + b).scalar(p) for p in xnew], y))
+            self.assertTrue(np.array_equal(a(xnew) + b(xnew), y))
+            self.assertTrue(np.array_equal(Stroke(x, np.stack([[0, 1, 2, 3]] * 2))(xnew)[1], y / 11))
+
+    def test_backend(self):
+
+        s = np.cos(3 * self.f3) + self.f1
+        t = (np.cos(3 * Stroke(self.x, self.y, "cubic", backend="scipy"))
+             + Stroke(self.x, self.y, "linear", backend="scipy"))
+
+        self.assertTrue(np.allclose(t(self.xnew), s(self.xnew), rtol=1e-12))
+        self.assertTrue(np.allclose(pickle.loads(pickle.dumps(t))(self.xnew), s(self.xnew), rtol=1e-12))
+        self.assertIsNotNone(pickle.loads(pickle.dumps(t))._f._f)
+
+    def test_channels(self):
+
+        ys = np.stack([self.y, np.sin(self.x), np.cos(self.x)])
+
+        for backend in ["polare", "scipy"]:
+
+            s = Stroke(self.x, ys, "cubic", backend=backend)
+            y = s(self.xnew)
+
+            self.assertEqual(y.shape, (3, 100))
+            for i in range(3):
+                yi = Stroke(self.x, ys[i], "cubic", backend=backend)(self.xnew)
+                self.assertTrue(np.allclose(y[i], yi))
+                self.assertTrue(np.allclose(s[i](self.xnew), yi))
+
+            self.assertTrue(np.allclose((2 * s)(self.xnew[::-1]), 2 * y[:, ::-1]))
+            self.assertTrue(np.allclose(s[1:](self.xnew), y[1:]))
+
+        s = Stroke(self.x, ys, "cubic")
+        t = evaluate_many([s[0] * s[1], s[2] + 1], self.xnew)
+
+        self.assertTrue(np.allclose(t, [y[0] * y[1], y[2] + 1]))
+        self.assertEqual((s[0] * s[1])._n, 4)
+        self.assertIs(s[0]._f, s._f)
+        self.assertEqual(evaluate_many([s, s[0], 1], self.xnew).shape, (3, 3, 100))
+
+        self.assertTrue(np.allclose(s.compile()(self.xnew), y))
+        self.assertTrue(np.allclose(s.evaluate(self.xnew, chunk_size=7), y))
+        self.assertTrue(np.allclose(pickle.loads(pickle.dumps(s[2]))(self.xnew), y[2]))
+        self.assertRaises(TypeError, list, s)
+
+        self.assertTrue(np.allclose(s[..., 1](self.xnew), y[1]))
+        for stroke, key in [(self.f1, 0), (s, (0, 3)), (s, 3), (s[0], 0), (2 * s[1:], (0, 0)), (s, (..., ...))]:
+            self.assertRaises(IndexError, stroke.__getitem__, key)
+
+    def test_channel_views_of_buffers(self):
+
+        s = Stroke(self.x, np.stack([np.sin(self.x), np.cos(self.x)]))
+        e = (s * 2)[0] + (s * 3)[1]
+        y = 2 * np.sin(self.xnew) + 3 * np.cos(self.xnew)
+
+        self.assertTrue(np.allclose(e(self.xnew), y, atol=0.05))
+        for evaluate in [e.compile(), lambda xn: e.bind(xn)(), e.evaluate,
+                         lambda xn: np.concatenate(list(e.iter_evaluate(xn, chunk_size=7)))]:
+            self.assertTrue(np.allclose(evaluate(self.xnew), e(self.xnew)))
+
+        q = np.linspace(0, 1, 6)
+        t = Stroke(q, np.stack([q, q]))
+
+        self.assertTrue(np.allclose(np.concatenate(list((t * 2)[0].iter_evaluate(q, chunk_size=3))), 2 * q))
+
+    def test_scalar(self):
+
+        ys = np.stack([self.y, np.sin(self.x)])
+        points = [-1, -0.35, 0.2, 1]
+
+        for backend in ["polare", "scipy"]:
+            for kind in ["linear", "quadratic", "cubic"]:
+
+                f = Stroke(self.x, self.y, kind, backend=backend)
+                g = Stroke(self.x, ys, kind, backend=backend)
+
+                for s in [f, np.sin(f * 2) - f / 3, np.power(f, 2.5) + f ** 3, g[1] * f, 2 * g]:
+                    for p in points:
+                        self.assertTrue(np.allclose(s.scalar(p), s(p)[..., 0]))
+
+        z = (self.f1 > 0.1) * self.f1 * -2.5
+        with np.errstate(divide="ignore"):
+            for s in [self.f1 ** 3, np.power(z, -3), np.power(z, 2.5), np.float_power(z, -1.5), z ** 17]:
+                for p in [-1, -0.35, 0, 0.2, 1]:
+                    self.assertTrue(np.array_equal(s.scalar(p), s(p)[0]))
+
+        self.assertIsInstance(self.f3.scalar(0.5), np.floating)
+        self.assertEqual((self.f1 - self.f1 + 1).scalar(0), 1)
+        self.assertRaises(ValueError, self.f1.scalar, 2)
+
+    def test_fused_power(self):
+
+        y1 = self.f1(self.xnew)
+
+        for s, val in [(self.f1 ** 3, y1 ** 3),
+                       (np.power(self.f1, 2.5), np.sign(y1) * np.abs(y1) ** 2.5),
+                       (np.float_power(self.f1, -2), y1 ** -2.0),
+                       (np.power(-2.0, self.f1 - self.f1 + 3), np.full(100, -8.0))]:
+
+            self.assertTrue(np.allclose(s(self.xnew), val))
+
+        self.assertEqual((self.f1 ** 3)._n, 2)
+        self.assertEqual((abs(self.f1) ** abs(self.f3))._n, 5)
+
+        z = (self.f1 > 0.1) * self.f1 * -2.5
+        yz = z(self.xnew)
+        self.assertTrue(np.any(np.signbit(yz) & (yz == 0)))
+
+        with np.errstate(divide="ignore"):
+            for b in [-1, -1.5, 3, 2.5, -2]:
+                val = np.where((yz < 0) & (b % 2 != 0), -1, 1) * np.abs(yz) ** float(b)
+                self.assertTrue(np.allclose(np.power(z, b)(self.xnew), val))
+                self.assertTrue(np.allclose([np.power(z, b).scalar(p) for p in self.xnew], val))
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            for b in [np.inf, -np.inf, np.nan]:
+                val = np.where(y1 < 0, -1, 1) * np.abs(y1) ** b
+                self.assertTrue(np.allclose(np.power(self.f1, b)(self.xnew), val, equal_nan=True))
+
+    def test_no_dead_instructions(self):
+
+        v1 = np.array([self.f1, self.f3, self.f1 * self.f3])
+        v2 = np.array([self.f3, 2 * self.f1, 1])
+
+        for s in [np.dot(v1, v2), np.sum(v1), np.linalg.norm(v1), np.matmul(np.outer(v1, v2), v1)[0],
+                  np.power(self.f1, self.f3), np.arctan2(self.f1, self.f3), np.float_power(2, self.f3)]:
+            self.assertEqual(_order(s._inst, s._n - 1), list(range(s._n)))
+
+        inst = [[None, None, None, self.f1._f], [np.sin, 0, None, None], [np.cos, 0, None, None]]
+        merged, index = _extend_inst([[None, None, None, self.f3._f]], 1, inst, 3)
+
+        self.assertEqual(len(merged), 3)
+        self.assertEqual(index, [1, None, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()